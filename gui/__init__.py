@@ -3,9 +3,28 @@ PDFTranslate2md GUI パッケージ
 PyQt5ベースのデスクトップGUIアプリケーション
 """
 
-from .main_gui import MainWindow, main
-from .gui_app_controller import GuiAppController, ProcessingSignals
-from .history_manager import HistoryManager, ProcessingHistory
+import importlib
+
+# 公開名と定義モジュールの対応（サブモジュールは初回アクセス時に読み込む）
+_LAZY_EXPORTS = {
+    'MainWindow': '.main_gui',
+    'main': '.main_gui',
+    'GuiAppController': '.gui_app_controller',
+    'ProcessingSignals': '.gui_app_controller',
+    'HistoryManager': '.history_manager',
+    'ProcessingHistory': '.history_manager',
+}
+
+
+def __getattr__(name):
+    """公開名へのアクセス時に対応するサブモジュールを読み込む"""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "1.0.0"
 __all__ = [
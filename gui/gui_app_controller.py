@@ -6,14 +6,20 @@ GUI用のアプリケーション制御層
 import sys
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 from typing import Optional, Dict, Any, Callable, List, Tuple
-from PyQt5.QtCore import QThread, pyqtSignal, QObject
+from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot, QObject, QMutex, QMutexLocker
 import time
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.app_controller import AppController, ProcessingResult
+from src.pdf_extractor import extract_text, extract_images
+from src.markdown_writer import write_markdown
+from src.translator_service import TranslationCancelledError
+from gui.provider_catalog import AVAILABLE_PROVIDERS, AVAILABLE_MODELS
 
 
 class ProcessingSignals(QObject):
@@ -25,11 +31,19 @@ class ProcessingSignals(QObject):
     error_occurred = pyqtSignal(str)  # エラーメッセージ
     processing_finished = pyqtSignal(bool, str)  # 成功フラグ, 結果メッセージ
     log_message = pyqtSignal(str, str)  # ログレベル, メッセージ
+    log_messages_batch = pyqtSignal(list)  # [(ログレベル, メッセージ), ...]
+
+
+# キャンセル後も終了処理中のスレッド（破棄されないよう終了まで参照を保持する）
+_lingering_threads = set()
 
 
 class ProcessingThread(QThread):
     """バックグラウンドでPDF処理を行うスレッド"""
     
+    # キャンセル時にスレッドの終了を待つ最大時間（ミリ秒）
+    CANCEL_WAIT_MS = 5000
+    
     def __init__(self, controller: 'GuiAppController', input_path: str, 
                  output_dir: str, image_dir: str, force_overwrite: bool = False):
         super().__init__()
@@ -39,7 +53,8 @@ class ProcessingThread(QThread):
         self.image_dir = image_dir
         self.force_overwrite = force_overwrite
         self.signals = ProcessingSignals()
-        self._is_cancelled = False
+        # ワーカースレッド間で共有するキャンセルフラグ
+        self.cancel_event = threading.Event()
     
     def run(self):
         """処理の実行"""
@@ -52,21 +67,35 @@ class ProcessingThread(QThread):
                 self.signals
             )
             
-            if not self._is_cancelled:
+            if not self.cancel_event.is_set():
                 message = "処理が正常に完了しました。" if success else "処理中にエラーが発生しました。"
                 self.signals.processing_finished.emit(success, message)
                 
         except Exception as e:
-            if not self._is_cancelled:
+            if not self.cancel_event.is_set():
                 error_msg = f"処理中に予期しないエラーが発生しました: {str(e)}"
                 self.signals.error_occurred.emit(error_msg)
                 self.signals.processing_finished.emit(False, error_msg)
     
     def cancel(self):
         """処理のキャンセル"""
-        self._is_cancelled = True
-        self.terminate()
-        self.wait()
+        # terminate()は使用せず、キャンセルフラグを見て各処理に自発的に終了させる
+        self.cancel_event.set()
+        if not self.wait(self.CANCEL_WAIT_MS):
+            _lingering_threads.add(self)
+            self.finished.connect(lambda: _lingering_threads.discard(self))
+
+
+class ProviderProbeWorker(QObject):
+    """プロバイダー接続テストをバックグラウンドで実行するワーカー"""
+    
+    finished = pyqtSignal(bool, str)  # 成功フラグ, メッセージ
+    
+    @pyqtSlot(str, str)
+    def probe(self, provider_id: str, model: str):
+        """接続テストを実行し、結果をfinishedシグナルで通知する"""
+        success, message = GuiAppController.test_provider_connection(provider_id, model)
+        self.finished.emit(success, message)
 
 
 class GuiAppController(AppController):
@@ -80,16 +109,43 @@ class GuiAppController(AppController):
     - リアルタイムログ表示
     """
     
-    def __init__(self, provider_name: str, model_name: Optional[str] = None):
+    # ディレクトリ処理時に並列処理するファイル数のデフォルト値
+    DEFAULT_PARALLEL_FILES = 1
+    # 同時に実行する翻訳API呼び出し数のデフォルト値（全ファイル合計）
+    DEFAULT_PARALLEL_PAGES = 4
+    # 翻訳枠の空き待ち中にキャンセルを確認する間隔（秒）
+    TRANSLATION_SLOT_POLL_INTERVAL = 0.1
+    # 翻訳待機中に経過ログを出力する間隔（秒）
+    TRANSLATION_HEARTBEAT_INTERVAL = 5
+    
+    # 利用可能なプロバイダーとモデル（起動時にも参照するため軽量なモジュールで定義）
+    AVAILABLE_PROVIDERS = AVAILABLE_PROVIDERS
+    AVAILABLE_MODELS = AVAILABLE_MODELS
+    
+    def __init__(self, provider_name: str, model_name: Optional[str] = None,
+                 parallel_files: int = DEFAULT_PARALLEL_FILES,
+                 parallel_pages: int = DEFAULT_PARALLEL_PAGES):
         """
         GUI用アプリケーション制御層の初期化
         
         Args:
             provider_name: 使用するLLMプロバイダー名
             model_name: 使用するモデル名（省略時はデフォルト）
+            parallel_files: ディレクトリ処理時に並列処理するファイル数
+            parallel_pages: 同時に実行する翻訳API呼び出し数の上限（全ファイル合計）
         """
         super().__init__(provider_name, model_name)
         
+        self.parallel_files = max(1, parallel_files)
+        self.parallel_pages = max(1, parallel_pages)
+        
+        # 翻訳API呼び出しの同時実行枠（ファイル並列とページ並列で共有し、
+        # 合計の呼び出し数がparallel_pagesを超えないようにする）
+        self._translation_slots = threading.BoundedSemaphore(self.parallel_pages)
+        
+        # 作成済みディレクトリ（バッチ処理中に同じディレクトリを何度も作成しないため）
+        self._ensured_dirs = set()
+        
         # GUI用のログハンドラー設定
         self._setup_gui_logging()
         
@@ -101,20 +157,13 @@ class GuiAppController(AppController):
     
     def _setup_gui_logging(self):
         """GUI用のログ設定"""
-        # ログフォーマッターの設定
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        
         # 既存のハンドラーを削除
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
         
-        # ファイルハンドラーのみ追加（GUIでは画面にログを表示するため）
-        file_handler = logging.FileHandler('gui_pdftranslate2md.log', encoding='utf-8')
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        # ファイルへの書き込みはmain()で設定したルートロガーのQueueHandlerに任せる
+        # （同じログファイルに複数のハンドラーから書き込まないようにする）
+        self.logger.propagate = True
         self.logger.setLevel(logging.INFO)
     
     def start_processing_async(self, input_path: str, output_dir: str, image_dir: str, 
@@ -167,6 +216,37 @@ class GuiAppController(AppController):
         self.is_processing = False
         self.current_thread = None
     
+    def _ensure_dir(self, path: str) -> None:
+        """ディレクトリを作成する（作成済みのものは再確認しない）"""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+    
+    def _current_cancel_event(self) -> Optional[threading.Event]:
+        """現在の処理のキャンセル要求を取得する"""
+        thread = self.current_thread
+        return thread.cancel_event if thread is not None else None
+    
+    def _is_cancelled(self) -> bool:
+        """現在の処理がキャンセルされたかどうか"""
+        cancel_event = self._current_cancel_event()
+        return cancel_event is not None and cancel_event.is_set()
+    
+    def _translate_page_limited(self, cancel_event: Optional[threading.Event], **kwargs) -> Tuple[str, List[str]]:
+        """
+        同時実行枠の範囲内で1ページを翻訳する
+        
+        枠が空くまで待機し、その間にキャンセルされた場合はTranslationCancelledErrorを送出する。
+        """
+        while not self._translation_slots.acquire(timeout=self.TRANSLATION_SLOT_POLL_INTERVAL):
+            if cancel_event is not None and cancel_event.is_set():
+                raise TranslationCancelledError("翻訳処理がキャンセルされました")
+        try:
+            # キャンセル要求は共有のTranslatorServiceではなく呼び出しごとに渡す
+            return self.translator_service.translate_page(cancel_event=cancel_event, **kwargs)
+        finally:
+            self._translation_slots.release()
+    
     def process_input_path_with_signals(self, input_path: str, output_dir: str, 
                                       image_dir: str, force_overwrite: bool,
                                       signals: ProcessingSignals) -> bool:
@@ -210,10 +290,12 @@ class GuiAppController(AppController):
                                       image_dir: str, force_overwrite: bool,
                                       signals: ProcessingSignals) -> bool:
         """ディレクトリ処理（シグナル通知付き）"""
-        import glob
-        
-        # PDFファイルを検索
-        pdf_files = glob.glob(os.path.join(input_dir, "*.pdf"))
+        # PDFファイルを検索（scandirのエントリ情報を使い、ファイルごとのstatを避ける）
+        with os.scandir(input_dir) as entries:
+            pdf_files = sorted(
+                entry.path for entry in entries
+                if not entry.name.startswith('.') and entry.name.lower().endswith('.pdf') and entry.is_file()
+            )
         if not pdf_files:
             error_msg = f"ディレクトリ '{input_dir}' にPDFファイルが見つかりませんでした。"
             signals.error_occurred.emit(error_msg)
@@ -223,38 +305,76 @@ class GuiAppController(AppController):
         processed_count = 0
         failed_count = 0
         
-        signals.log_message.emit("INFO", f"{total_files}個のPDFファイルを処理します")
+        # 開始済みファイル数（ワーカースレッドから更新されるためミューテックスで保護）
+        started_count = 0
+        started_mutex = QMutex()
         
-        for i, pdf_file in enumerate(pdf_files):
-            if self.current_thread and self.current_thread._is_cancelled:
-                signals.log_message.emit("INFO", "処理がキャンセルされました")
-                return False
+        def process_in_worker(pdf_file: str, filename: str) -> Optional[ProcessingResult]:
+            """ワーカースレッドで1ファイルを処理する"""
+            nonlocal started_count
+            if self._is_cancelled():
+                return None
             
             # ファイル処理開始
-            filename = os.path.basename(pdf_file)
+            with QMutexLocker(started_mutex):
+                index = started_count
+                started_count += 1
             signals.file_started.emit(filename)
             signals.progress_updated.emit(
-                int((i / total_files) * 100), 
-                f"処理中: {filename} ({i+1}/{total_files})"
+                int((index / total_files) * 100), 
+                f"処理中: {filename} ({index+1}/{total_files})"
             )
             
             # 単一ファイル処理
-            result = self._process_single_pdf_with_signals(
+            return self._process_single_pdf_with_signals(
                 pdf_file, output_dir, image_dir, force_overwrite, signals
             )
+        
+        signals.log_message.emit("INFO", f"{total_files}個のPDFファイルを処理します（並列数: {self.parallel_files}）")
+        
+        executor = ThreadPoolExecutor(max_workers=self.parallel_files)
+        # ファイル名は投入時に一度だけ求め、ワーカーと結果集計の両方で使い回す
+        futures = {}
+        try:
+            for pdf_file in pdf_files:
+                filename = os.path.basename(pdf_file)
+                futures[executor.submit(process_in_worker, pdf_file, filename)] = filename
             
-            # 結果記録
-            if result.success:
-                processed_count += 1
-                signals.file_completed.emit(filename, True)
-                if not result.skipped:
-                    signals.log_message.emit("INFO", f"完了: {filename}")
+            for future in as_completed(futures):
+                if self._is_cancelled():
+                    # 未着手のファイルはプールの終了時に取り消される
+                    signals.log_message.emit("INFO", "処理がキャンセルされました")
+                    return False
+                
+                filename = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = ProcessingResult(success=False, error=str(e))
+                if result is None:
+                    continue
+                
+                # 結果記録
+                if result.success:
+                    processed_count += 1
+                    signals.file_completed.emit(filename, True)
+                    if not result.skipped:
+                        signals.log_message.emit("INFO", f"完了: {filename}")
+                    else:
+                        signals.log_message.emit("INFO", f"スキップ: {filename}")
                 else:
-                    signals.log_message.emit("INFO", f"スキップ: {filename}")
-            else:
-                failed_count += 1
-                signals.file_completed.emit(filename, False)
-                signals.log_message.emit("ERROR", f"失敗: {filename} - {result.error}")
+                    failed_count += 1
+                    signals.file_completed.emit(filename, False)
+                    signals.log_message.emit("ERROR", f"失敗: {filename} - {result.error}")
+        finally:
+            # キャンセル時は未着手の処理を取り消し、実行中の処理の終了を待たずにプールを離れる
+            # （実行中の翻訳はcancel_eventを見て自ら打ち切られる。
+            # Python 3.8でも動作するようshutdownのcancel_futuresは使用しない）
+            cancelled = self._is_cancelled()
+            if cancelled:
+                for future in futures:
+                    future.cancel()
+            executor.shutdown(wait=not cancelled)
         
         # 最終進捗更新
         signals.progress_updated.emit(100, "処理完了")
@@ -304,34 +424,33 @@ class GuiAppController(AppController):
         result = ProcessingResult(success=False)
         
         try:
-            # 基本的な検証
-            if not os.path.exists(input_pdf):
+            # 基本的な検証（存在確認とサイズ取得を1回のstatで行う）
+            try:
+                result.file_size = os.stat(input_pdf).st_size
+            except FileNotFoundError:
                 result.error = f"入力ファイルが見つかりません: {input_pdf}"
                 return result
             
-            result.file_size = os.path.getsize(input_pdf)
-            
-            # 出力パス設定
+            # 出力パス設定（ファイル名由来の値はここで一度だけ計算する）
             pdf_base = os.path.splitext(os.path.basename(input_pdf))[0]
             output_md = os.path.join(output_dir, f"{pdf_base}.md")
             result.output_path = output_md
             
-            # 既存ファイルチェック
-            if os.path.exists(output_md) and not force_overwrite:
+            # 既存ファイルチェック（強制上書き時はファイルを確認しない）
+            if not force_overwrite and os.path.exists(output_md):
                 result.skipped = True
                 result.success = True
                 return result
             
             # ディレクトリ作成
-            os.makedirs(output_dir, exist_ok=True)
+            self._ensure_dir(output_dir)
             pdf_image_dir = os.path.join(image_dir, pdf_base)
-            os.makedirs(pdf_image_dir, exist_ok=True)
+            self._ensure_dir(pdf_image_dir)
             
             # PDF処理開始
             signals.log_message.emit("INFO", f"PDFからテキストを抽出中...")
             
             # テキスト抽出
-            from src.pdf_extractor import extract_text, extract_images
             pages = extract_text(input_pdf)
             total_pages = len(pages)
             result.pages_processed = total_pages
@@ -350,69 +469,122 @@ class GuiAppController(AppController):
             
             # 翻訳処理
             signals.log_message.emit("INFO", "翻訳を開始します...")
-            translated_pages = []
+            translated_pages: List[Optional[str]] = [None] * total_pages
             all_headers = []
+            completed_pages = 0
             
-            for i, page in enumerate(pages):
-                if self.current_thread and self.current_thread._is_cancelled:
-                    result.error = "処理がキャンセルされました"
-                    return result
-                
-                page_info = {'current': i+1, 'total': total_pages}
-                
-                # ページ進捗通知
-                signals.page_progress.emit(i+1, total_pages, pdf_base)
-                progress = int(((i+1) / total_pages) * 80)  # 翻訳は全体の80%
-                signals.progress_updated.emit(progress, f"翻訳中: ページ {i+1}/{total_pages}")
-                
-                # UIイベントループを維持してブロッキングを防ぐ
-                from PyQt5.QtCore import QCoreApplication
-                signals.log_message.emit("DEBUG", f"[GUI-DEBUG] ページ{i+1}処理前 - UIイベント処理実行 - {time.strftime('%H:%M:%S')}")
-                QCoreApplication.processEvents()
-                
-                # 翻訳処理を確実に実行し、エラー時も次のページに進む
-                try:
-                    signals.log_message.emit("DEBUG", f"[GUI-DEBUG] ページ{i+1} - translate_page呼び出し開始 - {time.strftime('%H:%M:%S')}")
-                    translate_start = time.time()
+            # ページ単位のログはまとめて送信し、スレッド間のシグナル送信回数を抑える。
+            # DEBUGログは出力されない場合は文字列の生成自体を省略する
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            log_buffer: List[Tuple[str, str]] = []
+            
+            # ページをparallel_pages件ずつのウィンドウに分けて並列翻訳する。
+            # ウィンドウ内の各ページには、直前のウィンドウまでに得られたヘッダーを文脈として渡す
+            # （同時実行数は他のファイルと共有の翻訳枠で制限される）
+            cancel_event = self._current_cancel_event()
+            executor = ThreadPoolExecutor(max_workers=self.parallel_pages)
+            # 現在のウィンドウで投入したページ（キャンセル時に未着手のものを取り消す）
+            futures = {}
+            try:
+                for window_start in range(0, total_pages, self.parallel_pages):
+                    window_end = min(window_start + self.parallel_pages, total_pages)
+                    window_headers = list(all_headers)
                     
-                    # 翻訳処理を実行（途中で定期的にUIイベント処理）
-                    translated_text, headers = self._translate_page_with_ui_updates(
-                        page, page_info, all_headers, signals
-                    )
+                    if debug_enabled:
+                        timestamp = time.strftime('%H:%M:%S')
+                    futures = {}
+                    for i in range(window_start, window_end):
+                        page_info = {'current': i+1, 'total': total_pages}
+                        if debug_enabled:
+                            log_buffer.append(("DEBUG", f"[GUI-DEBUG] ページ{i+1} - translate_page呼び出し開始 - {timestamp}"))
+                        future = executor.submit(
+                            self._translate_page_limited,
+                            cancel_event,
+                            text=pages[i],
+                            page_info=page_info,
+                            previous_headers=window_headers
+                        )
+                        futures[future] = i
                     
-                    translate_duration = time.time() - translate_start
-                    signals.log_message.emit("DEBUG", f"[GUI-DEBUG] ページ{i+1} - translate_page完了 - {time.strftime('%H:%M:%S')} (所要時間: {translate_duration:.2f}秒)")
-                    translated_pages.append(translated_text)
-                    all_headers.extend(headers)
-                    signals.log_message.emit("INFO", f"ページ {i+1}/{total_pages} の翻訳が完了しました")
+                    if log_buffer:
+                        signals.log_messages_batch.emit(log_buffer)
+                        log_buffer = []
                     
-                    # 翻訳完了後もUIイベントループを維持
-                    signals.log_message.emit("DEBUG", f"[GUI-DEBUG] ページ{i+1}翻訳完了後 - UIイベント処理実行 - {time.strftime('%H:%M:%S')}")
-                    QCoreApplication.processEvents()
+                    headers_by_page: Dict[int, List[str]] = {}
                     
-                except Exception as e:
-                    error_msg = f"ページ {i+1} の翻訳に失敗しました: {str(e)}"
-                    signals.log_message.emit("WARNING", error_msg)
-                    signals.log_message.emit("DEBUG", f"[GUI-DEBUG] ページ{i+1}エラー処理 - {time.strftime('%H:%M:%S')}")
-                    # エラー時もページを追加して、確実に次のページに進む
-                    translated_pages.append(f"## 翻訳エラー\n\n{error_msg}\n\n---\n\n**原文:**\n\n{page}")
+                    # 完了したページから順に回収する（ポーリングせず完了通知で起床する）
+                    pending = set(futures)
+                    while pending:
+                        done, pending = wait(
+                            pending, timeout=self.TRANSLATION_HEARTBEAT_INTERVAL,
+                            return_when=FIRST_COMPLETED
+                        )
+                        if self._is_cancelled():
+                            result.error = "処理がキャンセルされました"
+                            return result
+                        
+                        if debug_enabled:
+                            timestamp = time.strftime('%H:%M:%S')
+                        
+                        if not done:
+                            if debug_enabled:
+                                signals.log_message.emit("DEBUG", f"[GUI-DEBUG] 翻訳処理継続中... - {timestamp}")
+                            continue
+                        
+                        for future in done:
+                            i = futures[future]
+                            completed_pages += 1
+                            
+                            # 翻訳結果を確実に回収し、エラー時も次のページに進む
+                            try:
+                                translated_text, headers = future.result()
+                                if debug_enabled:
+                                    log_buffer.append(("DEBUG", f"[GUI-DEBUG] ページ{i+1} - translate_page完了 - {timestamp}"))
+                                translated_pages[i] = translated_text
+                                headers_by_page[i] = headers
+                                log_buffer.append(("INFO", f"ページ {i+1}/{total_pages} の翻訳が完了しました"))
+                            
+                            except Exception as e:
+                                error_msg = f"ページ {i+1} の翻訳に失敗しました: {str(e)}"
+                                log_buffer.append(("WARNING", error_msg))
+                                if debug_enabled:
+                                    log_buffer.append(("DEBUG", f"[GUI-DEBUG] ページ{i+1}エラー処理 - {timestamp}"))
+                                # エラー時もページを追加して、確実に次のページに進む
+                                translated_pages[i] = f"## 翻訳エラー\n\n{error_msg}\n\n---\n\n**原文:**\n\n{pages[i]}"
+                                # エラー後も処理を継続
+                                continue
+                            finally:
+                                # 各ページ処理後の確実な状態更新
+                                if debug_enabled:
+                                    log_buffer.append(("DEBUG", f"ページ {i+1}/{total_pages} の処理を完了しました"))
+                        
+                        # ページ進捗通知（同時に完了したページはまとめて1回だけ通知する）
+                        signals.page_progress.emit(completed_pages, total_pages, pdf_base)
+                        progress = int((completed_pages / total_pages) * 80)  # 翻訳は全体の80%
+                        signals.progress_updated.emit(progress, f"翻訳中: ページ {completed_pages}/{total_pages}")
+                        
+                        # 完了したページ分のログを1回のシグナルで送信
+                        if log_buffer:
+                            signals.log_messages_batch.emit(log_buffer)
+                            log_buffer = []
                     
-                    # エラー処理後もUIイベントループを維持
-                    signals.log_message.emit("DEBUG", f"[GUI-DEBUG] ページ{i+1}エラー後 - UIイベント処理実行 - {time.strftime('%H:%M:%S')}")
-                    QCoreApplication.processEvents()
-                    # エラー後も処理を継続
-                    continue
-                finally:
-                    # 各ページ処理後の確実な状態更新
-                    signals.log_message.emit("DEBUG", f"ページ {i+1}/{total_pages} の処理を完了し、次のページに進みます")
-                    # 最終的にUIイベントループを維持
-                    QCoreApplication.processEvents()
+                    # 次のウィンドウの文脈となるヘッダーはページ順に統合する
+                    for i in sorted(headers_by_page):
+                        all_headers.extend(headers_by_page[i])
+            finally:
+                # キャンセル時は未着手の処理を取り消し、実行中の処理の終了を待たずにプールを離れる
+                # （実行中の翻訳はcancel_eventを見て自ら打ち切られる。
+                # Python 3.8でも動作するようshutdownのcancel_futuresは使用しない）
+                cancelled = self._is_cancelled()
+                if cancelled:
+                    for future in futures:
+                        future.cancel()
+                executor.shutdown(wait=not cancelled)
             
             # Markdown書き出し
             signals.progress_updated.emit(90, "Markdownファイルを作成中...")
             signals.log_message.emit("INFO", "Markdownファイルを作成中...")
             
-            from src.markdown_writer import write_markdown
             write_markdown(output_md, translated_pages, image_paths)
             
             # 完了
@@ -426,95 +598,18 @@ class GuiAppController(AppController):
             result.error = f"PDF処理中にエラーが発生しました: {str(e)}"
             return result
     
-    def _translate_page_with_ui_updates(self, page: str, page_info: Dict[str, int],
-                                      all_headers: List[str], signals: ProcessingSignals) -> Tuple[str, List[str]]:
-        """
-        UIイベント処理を組み込んだページ翻訳
-        
-        Args:
-            page: 翻訳するページテキスト
-            page_info: ページ情報
-            all_headers: これまでのヘッダー一覧
-            signals: シグナルオブジェクト
-            
-        Returns:
-            翻訳結果とヘッダーのタプル
-        """
-        import threading
-        import queue
-        from PyQt5.QtCore import QCoreApplication
-        
-        # 結果を格納するキュー
-        result_queue = queue.Queue()
-        exception_queue = queue.Queue()
-        
-        def translation_worker():
-            """翻訳処理を実行するワーカー関数"""
-            try:
-                translated_text, headers = self.translator_service.translate_page(
-                    text=page,
-                    page_info=page_info,
-                    previous_headers=all_headers
-                )
-                result_queue.put((translated_text, headers))
-            except Exception as e:
-                exception_queue.put(e)
-        
-        # ワーカースレッドで翻訳処理を実行
-        worker_thread = threading.Thread(target=translation_worker, daemon=True)
-        worker_thread.start()
-        
-        # UI更新タイマー
-        ui_update_interval = 0.5  # 0.5秒ごとにUI更新
-        last_ui_update = time.time()
-        elapsed_log_interval = 5  # 5秒ごとにログ出力
-        last_log_time = time.time()
-        
-        # 翻訳処理の完了を待機（定期的にUIイベントを処理）
-        while worker_thread.is_alive():
-            current_time = time.time()
-            
-            # UI更新
-            if current_time - last_ui_update >= ui_update_interval:
-                QCoreApplication.processEvents()
-                last_ui_update = current_time
-            
-            # 進捗ログ出力
-            if current_time - last_log_time >= elapsed_log_interval:
-                signals.log_message.emit("DEBUG", f"[GUI-DEBUG] 翻訳処理継続中... - {time.strftime('%H:%M:%S')}")
-                last_log_time = current_time
-            
-            # 短時間待機
-            worker_thread.join(timeout=0.1)
-        
-        # 例外が発生した場合
-        if not exception_queue.empty():
-            raise exception_queue.get()
-        
-        # 結果を取得
-        if not result_queue.empty():
-            return result_queue.get()
-        else:
-            raise Exception("翻訳処理が予期せず終了しました")
-    
-    def get_available_providers(self) -> List[Dict[str, str]]:
-        """利用可能なプロバイダー一覧を取得"""
-        return [
-            {'id': 'gemini', 'name': 'Google Gemini'},
-            {'id': 'openai', 'name': 'OpenAI GPT'},
-            {'id': 'anthropic', 'name': 'Anthropic Claude'}
-        ]
+    @classmethod
+    def get_available_providers(cls) -> List[Dict[str, str]]:
+        """利用可能なプロバイダー一覧を取得（インスタンスを作成せずに呼び出し可能）"""
+        return [dict(provider) for provider in cls.AVAILABLE_PROVIDERS]
     
-    def get_available_models(self, provider: str) -> List[str]:
-        """指定プロバイダーで利用可能なモデル一覧を取得"""
-        models = {
-            'gemini': ['gemini-2.5-flash-preview-04-17'],
-            'openai': ['gpt-4.1', 'gpt-4.1-mini'],
-            'anthropic': ['claude-3-7-sonnet']
-        }
-        return models.get(provider, [])
+    @classmethod
+    def get_available_models(cls, provider: str) -> List[str]:
+        """指定プロバイダーで利用可能なモデル一覧を取得（インスタンスを作成せずに呼び出し可能）"""
+        return list(cls.AVAILABLE_MODELS.get(provider, ()))
     
-    def test_provider_connection(self, provider: str, model: str = None) -> tuple[bool, str]:
+    @staticmethod
+    def test_provider_connection(provider: str, model: str = None) -> Tuple[bool, str]:
         """
         プロバイダー接続をテストする
         
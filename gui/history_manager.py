@@ -3,15 +3,62 @@
 処理設定の保存・読み込み・管理を行う
 """
 
+import atexit
+import heapq
 import json
 import os
+import sys
 import logging
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, fields
 
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    # orjsonが利用できない場合は標準のjsonを使用
+    orjson = None
+
+
+def _read_json(path: str) -> Any:
+    """JSONファイルを読み込む（orjsonが利用可能な場合は高速に解析）"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: str, data: Any) -> None:
+    """
+    JSONファイルを書き出す（orjsonが利用可能な場合は高速に直列化）
+    
+    一時ファイルに書き込んでから置き換えるため、書き込み中に異常終了しても
+    既存のファイルが壊れることはない。
+    """
+    tmp_path = path + '.tmp'
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# __slots__によるメモリ削減（slots引数はPython 3.10以降のみ対応）
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingHistory:
     """処理履歴を表すデータクラス"""
     id: str
@@ -28,7 +75,7 @@ class ProcessingHistory:
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
-        return asdict(self)
+        return {name: getattr(self, name) for name in _HISTORY_FIELDS}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProcessingHistory':
@@ -36,12 +83,41 @@ class ProcessingHistory:
         return cls(**data)
 
 
-class HistoryManager:
+# to_dictで使用するフィールド名（毎回fields()を走査しないようにキャッシュ）
+_HISTORY_FIELDS = tuple(f.name for f in fields(ProcessingHistory))
+
+
+class _HistoryReadTask(QRunnable):
+    """履歴ファイルの読み込みと解析をスレッドプールで行うタスク"""
+    
+    def __init__(self, manager: 'HistoryManager', version: int):
+        super().__init__()
+        self._manager = manager
+        self._version = version
+    
+    def run(self):
+        try:
+            histories, error = self._manager._read_history_file(), None
+        except Exception as e:
+            histories, error = None, e
+        self._manager._history_read.emit(histories, error, self._version)
+
+
+class HistoryManager(QObject):
     """
     処理履歴の管理クラス
     設定の保存、読み込み、削除などを管理する
     """
     
+    # 変更をまとめてファイルに書き出すまでの待機時間（ミリ秒）
+    SAVE_DELAY_MS = 500
+    
+    # シグナル
+    history_changed = pyqtSignal()  # 履歴が追加・削除・インポートされた時
+    
+    # ワーカースレッドで読み込んだ結果の受け渡し（履歴一覧, 例外, 読み込み開始時の_version）
+    _history_read = pyqtSignal(object, object, int)
+    
     def __init__(self, history_file: str = "gui_history.json"):
         """
         履歴管理の初期化
@@ -49,34 +125,143 @@ class HistoryManager:
         Args:
             history_file: 履歴保存ファイル名
         """
+        super().__init__()
         self.history_file = history_file
         self.history_list: List[ProcessingHistory] = []
         self.logger = logging.getLogger(__name__)
         
+        # 検索用インデックス（IDと設定内容のキーから履歴を引く）
+        self._by_id: Dict[str, ProcessingHistory] = {}
+        self._by_key: Dict[Tuple[str, str, str, str], ProcessingHistory] = {}
+        
+        # 並べ替え結果のキャッシュ（履歴が変更されるたびに_versionを進める）
+        self._version = 0
+        self._sorted_cache: List[ProcessingHistory] = []
+        self._sorted_cache_version = -1
+        
+        # 未保存の変更があるかどうか
+        self._dirty = False
+        
+        # ワーカースレッドで履歴ファイルを読み込み中かどうか
+        self._load_in_flight = False
+        self._history_read.connect(self._on_history_read)
+        
+        # 連続した変更を1回の書き込みにまとめるタイマー（Qtアプリケーション実行時のみ）
+        self._flush_timer: Optional[QTimer] = None
+        if QCoreApplication.instance() is not None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self.flush)
+        
+        # 終了時に未保存の変更を書き出す
+        atexit.register(self.flush)
+        
         # 履歴ファイルの読み込み
         self.load_history()
     
+    def _mark_dirty(self) -> None:
+        """変更を記録し、遅延保存を予約する"""
+        self._version += 1
+        self._dirty = True
+        if self._flush_timer is not None:
+            self._flush_timer.start(self.SAVE_DELAY_MS)
+        else:
+            self.save_history()
+    
+    def flush(self) -> bool:
+        """未保存の変更があればファイルに書き出す"""
+        if not self._dirty:
+            return True
+        return self.save_history()
+    
+    @staticmethod
+    def _history_key(history: ProcessingHistory) -> Tuple[str, str, str, str]:
+        """重複判定に使用するキーを取得"""
+        return (history.input_path, history.provider, history.model, history.output_dir)
+    
+    def _rebuild_index(self) -> None:
+        """検索用インデックスを再構築する"""
+        self._version += 1
+        self._by_id = {}
+        self._by_key = {}
+        for history in self.history_list:
+            self._by_id.setdefault(history.id, history)
+            self._by_key.setdefault(self._history_key(history), history)
+    
+    def _read_history_file(self) -> Optional[List[ProcessingHistory]]:
+        """
+        履歴ファイルを読み込んで解析する
+        
+        インスタンスの状態を変更しないため、ワーカースレッドからも呼び出せる
+        
+        Returns:
+            履歴一覧（ファイルが存在しない場合はNone）
+        """
+        if not os.path.exists(self.history_file):
+            return None
+        data = _read_json(self.history_file)
+        return [ProcessingHistory.from_dict(item) for item in data]
+    
+    def _set_loaded_history(self, histories: Optional[List[ProcessingHistory]],
+                            error: Optional[Exception]) -> None:
+        """読み込んだ履歴一覧を設定する"""
+        if error is not None:
+            self.logger.error(f"履歴の読み込みに失敗しました: {str(error)}")
+            self.history_list = []
+        elif histories is None:
+            self.history_list = []
+            self.logger.info("履歴ファイルが存在しません。新規作成します。")
+        else:
+            self.history_list = histories
+            self.logger.info(f"履歴を読み込みました: {len(self.history_list)}件")
+        self._rebuild_index()
+    
     def load_history(self) -> None:
         """履歴ファイルから履歴を読み込む"""
+        # 未保存の変更が失われないよう先に書き出す
+        self.flush()
+        
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.history_list = [ProcessingHistory.from_dict(item) for item in data]
-                self.logger.info(f"履歴を読み込みました: {len(self.history_list)}件")
-            else:
-                self.history_list = []
-                self.logger.info("履歴ファイルが存在しません。新規作成します。")
+            histories, error = self._read_history_file(), None
         except Exception as e:
-            self.logger.error(f"履歴の読み込みに失敗しました: {str(e)}")
-            self.history_list = []
+            histories, error = None, e
+        self._set_loaded_history(histories, error)
+    
+    def load_history_async(self) -> None:
+        """
+        履歴ファイルをワーカースレッドで読み込む
+        
+        読み込みが完了するとhistory_changedを発信する。読み込み中の再要求は無視する。
+        """
+        if self._load_in_flight:
+            return
+        
+        # 未保存の変更が失われないよう先に書き出す
+        self.flush()
+        
+        self._load_in_flight = True
+        QThreadPool.globalInstance().start(_HistoryReadTask(self, self._version))
+    
+    def _on_history_read(self, histories: Optional[List[ProcessingHistory]],
+                         error: Optional[Exception], version: int) -> None:
+        """ワーカースレッドでの読み込みが完了した時"""
+        self._load_in_flight = False
+        
+        # 読み込み中に履歴が変更された場合は、メモリ上の内容の方が新しいため破棄する
+        if version != self._version:
+            return
+        
+        self._set_loaded_history(histories, error)
+        self.history_changed.emit()
     
     def save_history(self) -> bool:
         """履歴をファイルに保存する"""
         try:
             data = [history.to_dict() for history in self.history_list]
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_json(self.history_file, data)
+            self._dirty = False
+            if self._flush_timer is not None:
+                self._flush_timer.stop()
             self.logger.info(f"履歴を保存しました: {len(self.history_list)}件")
             return True
         except Exception as e:
@@ -110,7 +295,8 @@ class HistoryManager:
             existing.use_count += 1
             existing.name = name  # 名前は更新
             existing.force_overwrite = force_overwrite
-            self.save_history()
+            self._mark_dirty()
+            self.history_changed.emit()
             return existing.id
         
         history = ProcessingHistory(
@@ -128,8 +314,11 @@ class HistoryManager:
         )
         
         self.history_list.append(history)
-        self.save_history()
+        self._by_id[history.id] = history
+        self._by_key[self._history_key(history)] = history
+        self._mark_dirty()
         self.logger.info(f"履歴を追加しました: {name}")
+        self.history_changed.emit()
         
         return history_id
     
@@ -147,29 +336,22 @@ class HistoryManager:
         Returns:
             類似の履歴項目（見つからない場合はNone）
         """
-        for history in self.history_list:
-            if (history.input_path == input_path and 
-                history.provider == provider and 
-                history.model == model and 
-                history.output_dir == output_dir):
-                return history
-        return None
+        return self._by_key.get((input_path, provider, model, output_dir))
     
     def get_history_list(self) -> List[ProcessingHistory]:
         """履歴一覧を取得する（使用回数の多い順でソート）"""
-        return sorted(self.history_list, key=lambda x: (x.use_count, x.last_used), reverse=True)
+        if self._sorted_cache_version != self._version:
+            self._sorted_cache = sorted(self.history_list, key=lambda x: (x.use_count, x.last_used), reverse=True)
+            self._sorted_cache_version = self._version
+        return list(self._sorted_cache)
     
     def get_recent_history(self, limit: int = 10) -> List[ProcessingHistory]:
         """最近使用した履歴を取得する"""
-        sorted_history = sorted(self.history_list, key=lambda x: x.last_used, reverse=True)
-        return sorted_history[:limit]
+        return heapq.nlargest(limit, self.history_list, key=lambda x: x.last_used)
     
     def get_history_by_id(self, history_id: str) -> Optional[ProcessingHistory]:
         """IDで履歴を取得する"""
-        for history in self.history_list:
-            if history.id == history_id:
-                return history
-        return None
+        return self._by_id.get(history_id)
     
     def update_history_usage(self, history_id: str) -> bool:
         """履歴の使用回数と最終使用日時を更新する"""
@@ -177,24 +359,39 @@ class HistoryManager:
         if history:
             history.use_count += 1
             history.last_used = datetime.now().isoformat()
-            self.save_history()
+            self._mark_dirty()
             return True
         return False
     
     def delete_history(self, history_id: str) -> bool:
         """履歴を削除する"""
-        for i, history in enumerate(self.history_list):
-            if history.id == history_id:
-                deleted_history = self.history_list.pop(i)
-                self.save_history()
-                self.logger.info(f"履歴を削除しました: {deleted_history.name}")
-                return True
-        return False
+        deleted_history = self._by_id.pop(history_id, None)
+        if deleted_history is None:
+            return False
+        
+        self.history_list = [h for h in self.history_list if h is not deleted_history]
+        
+        key = self._history_key(deleted_history)
+        if self._by_key.get(key) is deleted_history:
+            del self._by_key[key]
+            # 同じ設定の履歴が他にも存在する場合はそちらを登録し直す
+            for history in self.history_list:
+                if self._history_key(history) == key:
+                    self._by_key[key] = history
+                    break
+        
+        self._mark_dirty()
+        self.logger.info(f"履歴を削除しました: {deleted_history.name}")
+        self.history_changed.emit()
+        return True
     
     def clear_all_history(self) -> bool:
         """全ての履歴を削除する"""
         self.history_list.clear()
-        return self.save_history()
+        self._rebuild_index()
+        saved = self.save_history()
+        self.history_changed.emit()
+        return saved
     
     def get_history_stats(self) -> Dict[str, Any]:
         """履歴の統計情報を取得する"""
@@ -206,26 +403,26 @@ class HistoryManager:
                 'total_usage': 0
             }
         
-        # プロバイダー別使用回数
-        provider_usage = {}
-        model_usage = {}
+        # プロバイダー別・モデル別使用回数（1回の走査で集計）
+        provider_usage = Counter()
+        model_usage = Counter()
         total_usage = 0
         
         for history in self.history_list:
-            provider_usage[history.provider] = provider_usage.get(history.provider, 0) + history.use_count
-            model_usage[history.model] = model_usage.get(history.model, 0) + history.use_count
+            provider_usage[history.provider] += history.use_count
+            model_usage[history.model] += history.use_count
             total_usage += history.use_count
         
-        most_used_provider = max(provider_usage.items(), key=lambda x: x[1])[0] if provider_usage else None
-        most_used_model = max(model_usage.items(), key=lambda x: x[1])[0] if model_usage else None
+        most_used_provider = provider_usage.most_common(1)[0][0]
+        most_used_model = model_usage.most_common(1)[0][0]
         
         return {
             'total_count': len(self.history_list),
             'most_used_provider': most_used_provider,
             'most_used_model': most_used_model,
             'total_usage': total_usage,
-            'provider_usage': provider_usage,
-            'model_usage': model_usage
+            'provider_usage': dict(provider_usage),
+            'model_usage': dict(model_usage)
         }
     
     def export_history(self, export_file: str) -> bool:
@@ -237,8 +434,7 @@ class HistoryManager:
                 'history': [history.to_dict() for history in self.history_list]
             }
             
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_json(export_file, data)
             
             self.logger.info(f"履歴をエクスポートしました: {export_file}")
             return True
@@ -258,8 +454,7 @@ class HistoryManager:
             インポートが成功したかどうか
         """
         try:
-            with open(import_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(import_file)
             
             imported_history = [ProcessingHistory.from_dict(item) for item in data.get('history', [])]
             
@@ -269,12 +464,16 @@ class HistoryManager:
                     existing = self.get_history_by_id(new_history.id)
                     if not existing:
                         self.history_list.append(new_history)
+                        self._by_id[new_history.id] = new_history
             else:
                 # 既存履歴を置き換え
                 self.history_list = imported_history
             
+            self._rebuild_index()
+            
             self.save_history()
             self.logger.info(f"履歴をインポートしました: {len(imported_history)}件")
+            self.history_changed.emit()
             return True
         except Exception as e:
             self.logger.error(f"履歴のインポートに失敗しました: {str(e)}")
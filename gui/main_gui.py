@@ -6,33 +6,92 @@ PyQt5ベースのデスクトップGUIアプリケーション
 import sys
 import os
 import logging
-from typing import Optional, Dict, Any
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
 import traceback
 
+# プロジェクトルートとREADMEのパス（起動時に一度だけ計算する）
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_README_PATH = os.path.join(_PROJECT_ROOT, "README.md")
+_README_EXISTS = os.path.exists(_README_PATH)
+
 # プロジェクトルートをパスに追加
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, _PROJECT_ROOT)
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QTabWidget, QLabel, QComboBox, 
+                             QHBoxLayout, QLabel, QComboBox, 
                              QPushButton, QLineEdit, QCheckBox, QGroupBox,
-                             QSplitter, QMessageBox, QStatusBar, QMenuBar,
-                             QAction, QFileDialog, QDialog, QDialogButtonBox,
-                             QTextEdit, QProgressDialog)
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, QThread, QSettings
-from PyQt5.QtGui import QIcon, QFont, QPixmap, QDesktopServices
-from PyQt5.Qt import QUrl
+                             QSplitter, QMessageBox, QAction, QFileDialog, QDialog)
+from PyQt5.QtCore import (Qt, QObject, QTimer, pyqtSignal, pyqtSlot, QThread, QSettings,
+                          QSignalBlocker, QSize, QUrl)
+from PyQt5.QtGui import QFont, QDesktopServices, QIcon, QPainter, QPixmap, QPixmapCache
 
-from gui.gui_app_controller import GuiAppController, ProcessingSignals
-from gui.history_manager import ProcessingHistory
 from gui.widgets import FileDropWidget, ProgressWidget, HistoryWidget
 from gui.theme_manager import get_theme_manager
 from gui.notification_manager import NotificationManager
-from gui.settings_dialog import SettingsDialog
+from gui.provider_catalog import AVAILABLE_PROVIDERS, AVAILABLE_MODELS
+
+# 制御層（PDF処理・翻訳モジュールを読み込むため重い）と設定ダイアログは
+# 使用時に読み込み、ウィンドウ表示までの時間を短縮する
+if TYPE_CHECKING:
+    from gui.gui_app_controller import GuiAppController, ProcessingSignals, ProviderProbeWorker
+    from gui.history_manager import ProcessingHistory
+
+
+# ファイルダイアログのオプション（ネットワークドライブ等での大量のstat呼び出しを避ける）
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+DIR_DIALOG_OPTIONS = FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly
+
+def _emoji_icon(glyph: str, size: int, device_pixel_ratio: float) -> QIcon:
+    """
+    絵文字をアイコン化する（描画結果はQPixmapCacheで共有される）
+    
+    Args:
+        glyph: 絵文字
+        size: アイコンサイズ（論理ピクセル）
+        device_pixel_ratio: 表示先ウィジェットのデバイスピクセル比
+        
+    Returns:
+        QIcon: 絵文字アイコン
+    """
+    key = f"emoji:{glyph}:{size}:{device_pixel_ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        physical_size = int(round(size * device_pixel_ratio))
+        pixmap = QPixmap(physical_size, physical_size)
+        pixmap.fill(Qt.transparent)
+        
+        font = QFont()
+        font.setPixelSize(int(physical_size * 0.8))
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        
+        # 描画後に設定し、高DPI環境でも論理サイズで表示させる
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
 
 
 class AboutDialog(QDialog):
     """アバウトダイアログ"""
     
+    # タイトル用フォント（QApplication作成後の初回表示時に生成して共有する）
+    _title_font: Optional[QFont] = None
+    
+    @classmethod
+    def _get_title_font(cls) -> QFont:
+        """タイトル用フォントを取得"""
+        if cls._title_font is None:
+            cls._title_font = QFont()
+            cls._title_font.setPointSize(18)
+            cls._title_font.setBold(True)
+        return cls._title_font
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("PDFTranslate2md について")
@@ -43,10 +102,7 @@ class AboutDialog(QDialog):
         
         # タイトル
         title = QLabel("PDFTranslate2md")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._get_title_font())
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -76,9 +132,108 @@ class AboutDialog(QDialog):
         self.setLayout(layout)
 
 
+class ProgressCoalescer(QObject):
+    """
+    処理スレッドからの進捗シグナルをまとめてProgressWidgetに反映する
+    
+    高頻度で届く進捗は最新の値だけを保持し、一定間隔でまとめて描画する。
+    ログはProgressWidget側でまとめて書き込むため、そのまま転送する。
+    ファイル開始・完了やエラーなどの通知は、表示順が崩れないよう
+    保持中の進捗を反映してから転送する。
+    """
+    
+    # 保持中の進捗を反映する間隔（ミリ秒、約30Hz）
+    FLUSH_INTERVAL_MS = 33
+    
+    def __init__(self, progress_widget: ProgressWidget, parent=None):
+        super().__init__(parent)
+        self.progress_widget = progress_widget
+        
+        self._progress: Optional[Tuple[int, str]] = None
+        self._page_progress: Optional[Tuple[int, int, str]] = None
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+    
+    def connect_signals(self, signals: 'ProcessingSignals'):
+        """処理シグナルを接続"""
+        signals.progress_updated.connect(self.update_overall_progress, Qt.QueuedConnection)
+        signals.page_progress.connect(self.update_page_progress, Qt.QueuedConnection)
+        signals.log_message.connect(self.progress_widget.add_log, Qt.QueuedConnection)
+        signals.log_messages_batch.connect(self.progress_widget.add_logs, Qt.QueuedConnection)
+        signals.file_started.connect(self.start_file_processing, Qt.QueuedConnection)
+        signals.file_completed.connect(self.finish_file_processing, Qt.QueuedConnection)
+        signals.error_occurred.connect(self.show_error, Qt.QueuedConnection)
+    
+    def _schedule_flush(self):
+        """保持中の進捗の反映を予約"""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    @pyqtSlot(int, str)
+    def update_overall_progress(self, progress: int, message: str):
+        """全体進捗（最新の値のみ保持）"""
+        self._progress = (progress, message)
+        self._schedule_flush()
+    
+    @pyqtSlot(int, int, str)
+    def update_page_progress(self, current_page: int, total_pages: int, filename: str):
+        """ページ進捗（最新の値のみ保持）"""
+        self._page_progress = (current_page, total_pages, filename)
+        self._schedule_flush()
+    
+    @pyqtSlot(str)
+    def start_file_processing(self, filename: str):
+        """ファイル処理開始を転送"""
+        self.flush()
+        self.progress_widget.start_file_processing(filename)
+    
+    @pyqtSlot(str, bool)
+    def finish_file_processing(self, filename: str, success: bool):
+        """ファイル処理終了を転送"""
+        self.flush()
+        self.progress_widget.finish_file_processing(filename, success)
+    
+    @pyqtSlot(str)
+    def show_error(self, error_message: str):
+        """エラーを転送"""
+        self.flush()
+        self.progress_widget.show_error(error_message)
+    
+    @pyqtSlot()
+    def flush(self):
+        """保持中の進捗をまとめてProgressWidgetに反映"""
+        self._flush_timer.stop()
+        
+        if self._page_progress is not None:
+            self.progress_widget.update_page_progress(*self._page_progress)
+            self._page_progress = None
+        
+        if self._progress is not None:
+            self.progress_widget.update_overall_progress(*self._progress)
+            self._progress = None
+
+
 class MainWindow(QMainWindow):
     """メインウィンドウ"""
     
+    # 接続テストの実行要求（ワーカースレッドへキュー接続で渡す）
+    _probe_requested = pyqtSignal(str, str)
+    
+    # プロバイダー選択変更をまとめる待機時間（ミリ秒）
+    PROVIDER_DEBOUNCE_MS = 150
+    
+    # ボタンの絵文字アイコンのサイズ（論理ピクセル）
+    ICON_SIZE = 16
+    
+    # ステータスバー・履歴名の書式
+    _STATUS_FMT = "プロバイダー: {provider_id} / {model}"
+    _STATUS_UNSET = "プロバイダー: 未設定"
+    _HISTORY_NAME_FMT = "{basename} ({timestamp})"
+    _HISTORY_TIMESTAMP_FMT = "%Y-%m-%d %H:%M"
+    
     def __init__(self):
         super().__init__()
         
@@ -86,14 +241,28 @@ class MainWindow(QMainWindow):
         self.settings = QSettings('PDFTranslate2md', 'GUI')
         
         # 制御層
-        self.controller: Optional[GuiAppController] = None
+        self.controller: Optional['GuiAppController'] = None
         
-        # 履歴保存管理フラグ
-        self._history_saved_for_current_session = False
+        # 前回終了時のプロバイダーとモデル（_load_settingsで設定）
+        self._last_provider = ""
+        self._last_model = ""
+        
+        # プロバイダー別のモデル一覧（_load_provider_infoで設定）
+        self._models_by_provider: Dict[str, List[str]] = {}
+        
+        # ダイアログ（初回表示時に作成して再利用する）
+        self._about_dialog: Optional[AboutDialog] = None
+        self._settings_dialog = None
+        
+        # 接続テスト用のワーカースレッド（初回の接続テスト時に作成）
+        self._probe_thread: Optional[QThread] = None
+        self._probe_worker: Optional['ProviderProbeWorker'] = None
+        
+        # 現在のセッションで履歴に保存した設定（入力パス, プロバイダー, モデル）
+        self._session_history_key: Optional[Tuple[str, str, str]] = None
         
         # テーマ管理
         self.theme_manager = get_theme_manager()
-        self.theme_manager.theme_changed.connect(self._on_theme_changed)
         
         # 通知管理
         self.notification_manager = NotificationManager(self)
@@ -101,6 +270,7 @@ class MainWindow(QMainWindow):
         
         # UI初期化
         self._setup_ui()
+        self._progress_coalescer = ProgressCoalescer(self.progress_widget, self)
         self._setup_menu()
         self._setup_status_bar()
         self._load_settings()
@@ -115,8 +285,9 @@ class MainWindow(QMainWindow):
         # プロバイダー情報を読み込み
         self._load_provider_info()
         
-        # テーマを適用
+        # テーマを適用（テーマ変更の通知は全ウィジェット作成後に受け付ける）
         self._apply_theme()
+        self.theme_manager.theme_changed.connect(self._on_theme_changed)
     
     def _setup_ui(self):
         """UIの設定"""
@@ -169,10 +340,15 @@ class MainWindow(QMainWindow):
         provider_layout.addWidget(QLabel("プロバイダー:"))
         
         self.provider_combo = QComboBox()
-        self.provider_combo.currentTextChanged.connect(self._on_provider_changed)
+        # 連続した選択変更はまとめて1回だけモデル一覧を更新する
+        self._provider_debounce = QTimer(self)
+        self._provider_debounce.setSingleShot(True)
+        self._provider_debounce.setInterval(self.PROVIDER_DEBOUNCE_MS)
+        self._provider_debounce.timeout.connect(self._on_provider_changed)
+        self.provider_combo.currentTextChanged.connect(self._provider_debounce.start)
         provider_layout.addWidget(self.provider_combo)
         
-        self.test_provider_button = QPushButton("🔍 接続テスト")
+        self.test_provider_button = self._create_icon_button("🔍", "接続テスト")
         self.test_provider_button.clicked.connect(self._test_provider_connection)
         # スタイルはテーマ適用時に設定
         provider_layout.addWidget(self.test_provider_button)
@@ -203,7 +379,7 @@ class MainWindow(QMainWindow):
         self.output_dir_edit.setPlaceholderText("出力ディレクトリを選択...")
         output_dir_layout.addWidget(self.output_dir_edit)
         
-        self.output_dir_button = QPushButton("📁")
+        self.output_dir_button = self._create_icon_button("📁")
         self.output_dir_button.clicked.connect(self._select_output_dir)
         self.output_dir_button.setFixedSize(30, 30)
         output_dir_layout.addWidget(self.output_dir_button)
@@ -218,7 +394,7 @@ class MainWindow(QMainWindow):
         self.image_dir_edit.setPlaceholderText("画像ディレクトリを選択...")
         image_dir_layout.addWidget(self.image_dir_edit)
         
-        self.image_dir_button = QPushButton("📁")
+        self.image_dir_button = self._create_icon_button("📁")
         self.image_dir_button.clicked.connect(self._select_image_dir)
         self.image_dir_button.setFixedSize(30, 30)
         image_dir_layout.addWidget(self.image_dir_button)
@@ -235,12 +411,12 @@ class MainWindow(QMainWindow):
         # 処理制御ボタン
         button_layout = QHBoxLayout()
         
-        self.start_button = QPushButton("🚀 処理開始")
+        self.start_button = self._create_icon_button("🚀", "処理開始")
         self.start_button.clicked.connect(self._start_processing)
         # スタイルはテーマ適用時に設定
         button_layout.addWidget(self.start_button)
         
-        self.cancel_button = QPushButton("⏹️ キャンセル")
+        self.cancel_button = self._create_icon_button("⏹️", "キャンセル")
         self.cancel_button.clicked.connect(self._cancel_processing)
         self.cancel_button.setEnabled(False)
         # スタイルはテーマ適用時に設定
@@ -254,6 +430,13 @@ class MainWindow(QMainWindow):
         
         return panel
     
+    def _create_icon_button(self, glyph: str, text: str = "") -> QPushButton:
+        """絵文字アイコン付きのボタンを作成（テーマ変更時は再描画しない）"""
+        size = self.ICON_SIZE
+        button = QPushButton(_emoji_icon(glyph, size, self.devicePixelRatioF()), text)
+        button.setIconSize(QSize(size, size))
+        return button
+    
     def _create_right_panel(self) -> QWidget:
         """右パネル（履歴）を作成"""
         panel = QWidget()
@@ -321,9 +504,9 @@ class MainWindow(QMainWindow):
         if geometry:
             self.restoreGeometry(geometry)
         
-        # 最後の設定
-        last_provider = self.settings.value("last_provider", "")
-        last_model = self.settings.value("last_model", "")
+        # 最後の設定（プロバイダーとモデルは選択肢の復元で繰り返し参照するため保持しておく）
+        self._last_provider = self.settings.value("last_provider", "")
+        self._last_model = self.settings.value("last_model", "")
         last_output_dir = self.settings.value("last_output_dir", "")
         last_image_dir = self.settings.value("last_image_dir", "")
         force_overwrite = self.settings.value("force_overwrite", False, type=bool)
@@ -347,55 +530,70 @@ class MainWindow(QMainWindow):
     def _load_provider_info(self):
         """プロバイダー情報を読み込み"""
         try:
-            # 一時的にコントローラーを作成してプロバイダー情報を取得
-            temp_controller = GuiAppController("gemini")  # デフォルト
-            providers = temp_controller.get_available_providers()
-            
-            self.provider_combo.clear()
-            for provider in providers:
-                self.provider_combo.addItem(provider['name'], provider['id'])
-            
-            # 最後の設定を復元
-            last_provider = self.settings.value("last_provider", "")
-            if last_provider:
-                index = self.provider_combo.findData(last_provider)
-                if index >= 0:
-                    self.provider_combo.setCurrentIndex(index)
+            # 一覧は軽量なprovider_catalogから取得する（制御層は読み込まない）
+            self._models_by_provider = {
+                provider_id: list(models) for provider_id, models in AVAILABLE_MODELS.items()
+            }
+            self._populate_providers([dict(provider) for provider in AVAILABLE_PROVIDERS])
             
-            self._on_provider_changed()
+            # 以前のバージョンが保存したプロバイダー情報のキャッシュを削除する
+            self.settings.remove("cache")
             
         except Exception as e:
             self.progress_widget.add_log("ERROR", f"プロバイダー情報の読み込みに失敗: {str(e)}")
     
+    def _populate_providers(self, providers: List[Dict[str, str]]):
+        """プロバイダー一覧をコンボボックスに反映"""
+        self.provider_combo.clear()
+        for provider in providers:
+            self.provider_combo.addItem(provider['name'], provider['id'])
+        
+        # 最後の設定を復元
+        if self._last_provider:
+            index = self.provider_combo.findData(self._last_provider)
+            if index >= 0:
+                self.provider_combo.setCurrentIndex(index)
+        
+        self._on_provider_changed()
+    
     def _reset_ui_state(self):
         """UIの状態をリセット"""
         self.start_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
         self.status_bar.showMessage("準備完了")
         
-        # 履歴保存フラグをリセット（新しい処理に備える）
-        self._history_saved_for_current_session = False
+        # 履歴保存キーをリセット（新しい処理に備える）
+        self._session_history_key = None
     
     @pyqtSlot()
-    def _on_provider_changed(self):
-        """プロバイダーが変更された時"""
+    def _on_provider_changed(self, pending_model: Optional[str] = None):
+        """
+        プロバイダーが変更された時
+        
+        Args:
+            pending_model: モデル一覧の更新後に選択するモデル（省略時は前回の設定を復元）
+        """
+        # 直接呼び出された場合は待機中の更新を取り消す
+        self._provider_debounce.stop()
+        
         provider_id = self.provider_combo.currentData()
         if not provider_id:
             return
         
         try:
-            # 一時的にコントローラーを作成してモデル情報を取得
-            temp_controller = GuiAppController(provider_id)
-            models = temp_controller.get_available_models(provider_id)
+            # モデル情報は読み込み済みの一覧から取得（コントローラーは作成しない）
+            models = self._models_by_provider.get(provider_id, [])
             
             self.model_combo.clear()
-            self.model_combo.addItems(models)
+            self.model_combo.addItems(list(models))
             
-            # 最後の設定を復元
-            if provider_id == self.settings.value("last_provider", ""):
-                last_model = self.settings.value("last_model", "")
-                if last_model and last_model in models:
-                    self.model_combo.setCurrentText(last_model)
+            if pending_model and pending_model in models:
+                # 指定されたモデルを選択
+                self.model_combo.setCurrentText(pending_model)
+            elif provider_id == self._last_provider:
+                # 最後の設定を復元
+                if self._last_model and self._last_model in models:
+                    self.model_combo.setCurrentText(self._last_model)
             
             # プロバイダー状態を更新
             self._update_provider_status()
@@ -427,9 +625,9 @@ class MainWindow(QMainWindow):
         model = self.model_combo.currentText()
         
         if provider_id and model:
-            self.provider_status_label.setText(f"プロバイダー: {provider_id} / {model}")
+            self.provider_status_label.setText(self._STATUS_FMT.format(provider_id=provider_id, model=model))
         else:
-            self.provider_status_label.setText("プロバイダー: 未設定")
+            self.provider_status_label.setText(self._STATUS_UNSET)
     
     def _test_provider_connection(self):
         """プロバイダー接続をテスト"""
@@ -441,24 +639,51 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            temp_controller = GuiAppController(provider_id, model)
-            success, message = temp_controller.test_provider_connection(provider_id, model)
-            
-            if success:
-                QMessageBox.information(self, "接続テスト", f"✅ {message}")
-                self.progress_widget.add_log("INFO", f"接続テスト成功: {message}")
-            else:
-                QMessageBox.warning(self, "接続テスト", f"❌ {message}")
-                self.progress_widget.add_log("ERROR", f"接続テスト失敗: {message}")
+            # 接続テストはワーカースレッドで実行し、UIをブロックしない
+            self._ensure_probe_worker()
+            self.test_provider_button.setEnabled(False)
+            self.status_bar.showMessage("接続テスト中...")
+            self._probe_requested.emit(provider_id, model)
                 
         except Exception as e:
             error_msg = f"接続テスト中にエラーが発生しました: {str(e)}"
             QMessageBox.critical(self, "エラー", error_msg)
             self.progress_widget.add_log("ERROR", error_msg)
+            self.test_provider_button.setEnabled(True)
+    
+    def _ensure_probe_worker(self):
+        """接続テスト用のワーカースレッドを準備"""
+        if self._probe_thread is not None:
+            return
+        
+        from gui.gui_app_controller import ProviderProbeWorker
+        
+        self._probe_thread = QThread(self)
+        self._probe_worker = ProviderProbeWorker()
+        self._probe_worker.moveToThread(self._probe_thread)
+        self._probe_thread.finished.connect(self._probe_worker.deleteLater)
+        self._probe_requested.connect(self._probe_worker.probe)
+        self._probe_worker.finished.connect(self._on_probe_finished)
+        self._probe_thread.start()
+    
+    @pyqtSlot(bool, str)
+    def _on_probe_finished(self, success: bool, message: str):
+        """接続テスト完了時の処理"""
+        self.test_provider_button.setEnabled(True)
+        self.status_bar.showMessage("準備完了")
+        
+        if success:
+            QMessageBox.information(self, "接続テスト", f"✅ {message}")
+            self.progress_widget.add_log("INFO", f"接続テスト成功: {message}")
+        else:
+            QMessageBox.warning(self, "接続テスト", f"❌ {message}")
+            self.progress_widget.add_log("ERROR", f"接続テスト失敗: {message}")
     
     def _select_output_dir(self):
         """出力ディレクトリを選択"""
-        dir_path = QFileDialog.getExistingDirectory(self, "出力ディレクトリを選択")
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "出力ディレクトリを選択", self.output_dir_edit.text(), options=DIR_DIALOG_OPTIONS
+        )
         if dir_path:
             self.output_dir_edit.setText(dir_path)
             
@@ -468,7 +693,10 @@ class MainWindow(QMainWindow):
     
     def _select_image_dir(self):
         """画像ディレクトリを選択"""
-        dir_path = QFileDialog.getExistingDirectory(self, "画像ディレクトリを選択")
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "画像ディレクトリを選択", self.image_dir_edit.text() or self.output_dir_edit.text(),
+            options=DIR_DIALOG_OPTIONS
+        )
         if dir_path:
             self.image_dir_edit.setText(dir_path)
     
@@ -500,6 +728,7 @@ class MainWindow(QMainWindow):
         
         try:
             # コントローラーを作成
+            from gui.gui_app_controller import GuiAppController
             self.controller = GuiAppController(provider_id, model)
             
             # 非同期処理を開始
@@ -508,14 +737,9 @@ class MainWindow(QMainWindow):
             )
             
             # シグナル接続（Qt.QueuedConnectionを明示的に指定）
-            from PyQt5.QtCore import Qt
-            signals.progress_updated.connect(self.progress_widget.update_overall_progress, Qt.QueuedConnection)
-            signals.file_started.connect(self.progress_widget.start_file_processing, Qt.QueuedConnection)
-            signals.file_completed.connect(self.progress_widget.finish_file_processing, Qt.QueuedConnection)
-            signals.page_progress.connect(self.progress_widget.update_page_progress, Qt.QueuedConnection)
-            signals.error_occurred.connect(self.progress_widget.show_error, Qt.QueuedConnection)
+            # 進捗・ログはまとめて描画するため、ProgressCoalescer経由で接続する
+            self._progress_coalescer.connect_signals(signals)
             signals.processing_finished.connect(self._on_processing_finished, Qt.QueuedConnection)
-            signals.log_message.connect(self.progress_widget.add_log, Qt.QueuedConnection)
             
             # UI状態更新
             self.start_button.setEnabled(False)
@@ -550,6 +774,7 @@ class MainWindow(QMainWindow):
             
             if reply == QMessageBox.Yes:
                 if self.controller.cancel_processing():
+                    self._progress_coalescer.flush()
                     self.progress_widget.add_log("WARNING", "処理がキャンセルされました")
                     self.status_bar.showMessage("処理がキャンセルされました")
                     # 履歴ウィジェットの翻訳状態をリセット（タイマー再開）
@@ -561,6 +786,8 @@ class MainWindow(QMainWindow):
     @pyqtSlot(bool, str)
     def _on_processing_finished(self, success: bool, message: str):
         """処理完了時のコールバック"""
+        # 未反映の進捗・ログを先に表示する
+        self._progress_coalescer.flush()
         self.progress_widget.finish_processing(success, message)
         
         # 履歴ウィジェットの翻訳状態をリセット（タイマー再開）
@@ -581,38 +808,41 @@ class MainWindow(QMainWindow):
     
     def _save_current_settings_to_history(self):
         """現在の設定を履歴に保存（重複防止機能付き）"""
-        # 重複保存防止ガード
-        if self._history_saved_for_current_session:
+        input_path = self.file_drop_widget.get_selected_path()
+        provider_id = self.provider_combo.currentData()
+        model = self.model_combo.currentText()
+        history_key = (input_path, provider_id, model)
+        
+        # 重複保存防止ガード（同じ内容が保存済みの場合のみスキップ）
+        if self._session_history_key == history_key:
             self.progress_widget.add_log("DEBUG", "履歴は既に保存済みです（重複保存を回避）")
             return
             
         try:
-            input_path = self.file_drop_widget.get_selected_path()
-            provider_id = self.provider_combo.currentData()
-            model = self.model_combo.currentText()
             output_dir = self.output_dir_edit.text()
             image_dir = self.image_dir_edit.text()
             force_overwrite = self.force_overwrite_check.isChecked()
             
             # 履歴名を生成
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-            name = f"{os.path.basename(input_path)} ({timestamp})"
+            name = self._HISTORY_NAME_FMT.format(
+                basename=os.path.basename(input_path),
+                timestamp=datetime.now().strftime(self._HISTORY_TIMESTAMP_FMT)
+            )
             
             self.history_widget.add_history(
                 name, input_path, provider_id, model,
                 output_dir, image_dir, force_overwrite
             )
             
-            # 履歴保存フラグを設定
-            self._history_saved_for_current_session = True
+            # 保存済みの設定を記録
+            self._session_history_key = history_key
             self.progress_widget.add_log("INFO", "設定を履歴に保存しました")
             
         except Exception as e:
             self.progress_widget.add_log("WARNING", f"履歴保存に失敗: {str(e)}")
     
     @pyqtSlot(object)
-    def _apply_history(self, history: ProcessingHistory):
+    def _apply_history(self, history: 'ProcessingHistory'):
         """履歴を適用"""
         try:
             # ファイルパス
@@ -621,9 +851,11 @@ class MainWindow(QMainWindow):
             # プロバイダー
             provider_index = self.provider_combo.findData(history.provider)
             if provider_index >= 0:
-                self.provider_combo.setCurrentIndex(provider_index)
-                # モデルを設定（プロバイダー変更後に設定）
-                QTimer.singleShot(100, lambda: self.model_combo.setCurrentText(history.model))
+                # 変更シグナルを抑止し、モデル一覧の更新は下で1回だけ行う
+                with QSignalBlocker(self.provider_combo):
+                    self.provider_combo.setCurrentIndex(provider_index)
+                # モデル一覧を更新し、その場で履歴のモデルを選択する
+                self._on_provider_changed(pending_model=history.model)
             
             # 出力設定
             self.output_dir_edit.setText(history.output_dir)
@@ -643,16 +875,23 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "PDFファイルを選択",
-            "",
-            "PDFファイル (*.pdf)"
+            self.settings.value("last_open_dir", ""),
+            "PDFファイル (*.pdf)",
+            options=FILE_DIALOG_OPTIONS | QFileDialog.ReadOnly
         )
         
         if file_path:
+            # 次回は同じディレクトリから開く
+            self.settings.setValue("last_open_dir", os.path.dirname(file_path))
             self.file_drop_widget.set_selected_path(file_path)
     
     def _show_settings(self):
         """設定ダイアログを表示"""
-        dialog = SettingsDialog(self)
+        # ダイアログは初回表示時に作成し、以降は再利用する
+        if self._settings_dialog is None:
+            from gui.settings_dialog import SettingsDialog
+            self._settings_dialog = SettingsDialog(self)
+        dialog = self._settings_dialog
         
         # 現在の設定を読み込み
         notification_settings = self.notification_manager.get_notification_settings()
@@ -666,14 +905,14 @@ class MainWindow(QMainWindow):
     
     def _show_about(self):
         """アバウトダイアログを表示"""
-        dialog = AboutDialog(self)
-        dialog.exec_()
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec_()
     
     def _open_readme(self):
         """READMEを開く"""
-        readme_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "README.md")
-        if os.path.exists(readme_path):
-            QDesktopServices.openUrl(QUrl.fromLocalFile(readme_path))
+        if _README_EXISTS:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(_README_PATH))
         else:
             QMessageBox.information(self, "情報", "README.mdファイルが見つかりません。")
     
@@ -696,43 +935,51 @@ class MainWindow(QMainWindow):
             # 処理をキャンセル
             self.controller.cancel_processing()
         
-        # 設定を保存
+        # 設定を保存（まとめて書き出す）
         self._save_settings()
         self._save_notification_settings()
+        self.settings.sync()
+        
+        # 未保存の履歴を書き出す
+        self.history_widget.history_manager.flush()
         
         # 通知マネージャーをクリーンアップ
         if hasattr(self, 'notification_manager'):
             self.notification_manager.cleanup()
         
+        # 接続テスト用スレッドを停止
+        if self._probe_thread is not None:
+            self._probe_thread.quit()
+            self._probe_thread.wait()
+        
         event.accept()
     
     def _apply_theme(self):
         """テーマを適用"""
+        # ボタンのスタイルをテーマごとに一度だけ生成
+        generate = self.theme_manager.generate_button_style
+        self._btn_styles = {
+            "test": generate("info"),
+            "start": generate("success", padding="12px 24px", font_size="14px"),
+            "cancel": generate("danger", padding="12px 24px", font_size="14px"),
+            "dir": generate("secondary", padding="4px 8px"),
+        }
+        
         # ボタンのスタイルを更新
-        self.test_provider_button.setStyleSheet(self.theme_manager.generate_button_style("info"))
+        self.test_provider_button.setStyleSheet(self._btn_styles["test"])
         
         # 処理制御ボタンのスタイルを更新
-        start_style = self.theme_manager.generate_button_style("success")
-        start_style = start_style.replace("padding: 8px 16px;", "padding: 12px 24px; font-size: 14px;")
-        self.start_button.setStyleSheet(start_style)
-        
-        cancel_style = self.theme_manager.generate_button_style("danger")
-        cancel_style = cancel_style.replace("padding: 8px 16px;", "padding: 12px 24px; font-size: 14px;")
-        self.cancel_button.setStyleSheet(cancel_style)
+        self.start_button.setStyleSheet(self._btn_styles["start"])
+        self.cancel_button.setStyleSheet(self._btn_styles["cancel"])
         
         # 出力ディレクトリ選択ボタンのスタイル
-        dir_button_style = self.theme_manager.generate_button_style("secondary")
-        dir_button_style = dir_button_style.replace("padding: 8px 16px;", "padding: 4px 8px;")
-        self.output_dir_button.setStyleSheet(dir_button_style)
-        self.image_dir_button.setStyleSheet(dir_button_style)
+        self.output_dir_button.setStyleSheet(self._btn_styles["dir"])
+        self.image_dir_button.setStyleSheet(self._btn_styles["dir"])
         
         # 子ウィジェットにもテーマを適用
-        if hasattr(self, 'file_drop_widget'):
-            self.file_drop_widget.apply_theme(self.theme_manager)
-        if hasattr(self, 'progress_widget'):
-            self.progress_widget.apply_theme(self.theme_manager)
-        if hasattr(self, 'history_widget'):
-            self.history_widget.apply_theme(self.theme_manager)
+        self.file_drop_widget.apply_theme(self.theme_manager)
+        self.progress_widget.apply_theme(self.theme_manager)
+        self.history_widget.apply_theme(self.theme_manager)
     
     def _on_theme_changed(self, theme_name: str):
         """テーマが変更された時の処理"""
@@ -750,6 +997,40 @@ class MainWindow(QMainWindow):
         self.settings.setValue("notification_settings", settings)
 
 
+# 未処理例外ダイアログの最短表示間隔（秒）
+EXCEPTION_DIALOG_INTERVAL = 5.0
+_last_exception_dialog = 0.0
+_exception_dialog_open = False
+
+
+def _handle_uncaught_exception(exc_type, exc_value, exc_tb):
+    """
+    未処理例外のフック（ログに記録し、ダイアログは一定間隔で1回だけ表示する）
+    """
+    global _last_exception_dialog, _exception_dialog_open
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_tb)
+        return
+    
+    logging.getLogger(__name__).error("未処理の例外が発生しました", exc_info=(exc_type, exc_value, exc_tb))
+    
+    # ダイアログはGUIスレッドからのみ表示する
+    app = QApplication.instance()
+    if app is None or QThread.currentThread() is not app.thread():
+        return
+    
+    now = time.monotonic()
+    if _exception_dialog_open or now - _last_exception_dialog < EXCEPTION_DIALOG_INTERVAL:
+        return
+    
+    _exception_dialog_open = True
+    try:
+        QMessageBox.critical(None, "エラー", f"予期しないエラーが発生しました:\n{exc_value}\n\n詳細はログを確認してください。")
+    finally:
+        _exception_dialog_open = False
+        _last_exception_dialog = time.monotonic()
+
+
 def main():
     """メイン関数"""
     # アプリケーション作成
@@ -758,40 +1039,52 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("PDFTranslate2md")
     
-    # ログ設定
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('gui_pdftranslate2md.log', encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # ログ設定（書き込みはリスナースレッドで行い、GUIスレッドはキューに積むだけにする）
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('gui_pdftranslate2md.log', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, file_handler, stream_handler)
+    # 整形は出力側のハンドラーで行うため、キューにはメッセージ本文のみを積む
+    logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(log_queue)])
+    log_listener.start()
     
     try:
-        # メインウィンドウ作成・表示
-        window = MainWindow()
-        window.show()
-        
-        # イベントループ実行
-        sys.exit(app.exec_())
+        try:
+            # メインウィンドウ作成・表示
+            window = MainWindow()
+            window.show()
+            
+        except Exception as e:
+            error_msg = f"アプリケーションの起動に失敗しました:\n{str(e)}\n\n{traceback.format_exc()}"
+            logging.getLogger(__name__).error(error_msg)
+            
+            # エラーダイアログ表示
+            try:
+                msg_box = QMessageBox()
+                msg_box.setIcon(QMessageBox.Critical)
+                msg_box.setWindowTitle("起動エラー")
+                msg_box.setText("アプリケーションの起動に失敗しました。")
+                msg_box.setDetailedText(error_msg)
+                msg_box.exec_()
+            except:
+                pass
+            
+            sys.exit(1)
         
-    except Exception as e:
-        error_msg = f"アプリケーションの起動に失敗しました:\n{str(e)}\n\n{traceback.format_exc()}"
-        print(error_msg)
+        # イベントループ中の未処理例外はフックで処理する
+        sys.excepthook = _handle_uncaught_exception
         
-        # エラーダイアログ表示
-        try:
-            msg_box = QMessageBox()
-            msg_box.setIcon(QMessageBox.Critical)
-            msg_box.setWindowTitle("起動エラー")
-            msg_box.setText("アプリケーションの起動に失敗しました。")
-            msg_box.setDetailedText(error_msg)
-            msg_box.exec_()
-        except:
-            pass
-        
-        sys.exit(1)
+        # イベントループ実行
+        exit_code = app.exec_()
+    finally:
+        # 起動失敗時も含め、残りのログを書き出してからリスナーを停止する
+        log_listener.stop()
+    
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -3,22 +3,92 @@
 OS通知と音声通知を提供する
 """
 
+import datetime
 import os
 import platform
+import shutil
 import subprocess
 import threading
-from typing import Optional
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Callable, Optional
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QRunnable, QThreadPool
 from PyQt5.QtWidgets import QSystemTrayIcon, QMenu, QAction
 from PyQt5.QtGui import QIcon
 
+# macOSではpyobjcが利用可能ならosascriptを起動せずに直接通知する
+NSUserNotification = None
+NSUserNotificationCenter = None
+if platform.system() == "Darwin":
+    try:
+        from Foundation import NSUserNotification, NSUserNotificationCenter
+    except ImportError:
+        # pyobjcが利用できない場合はosascriptを使用
+        pass
+
+# アプリケーションアイコンの候補（プロジェクトルートからの相対パス）
+_APP_ICON_CANDIDATES = (
+    "icon.png",
+    "icon.ico",
+    "app_icon.png",
+    "app_icon.ico",
+    "assets/icon.png",
+    "assets/icon.ico"
+)
+
+
+# 通知の種類の重要度（まとめた通知は最も重要度の高い種類で送信する）
+NOTIFICATION_SEVERITY = {
+    "info": 0,
+    "success": 1,
+    "warning": 2,
+    "error": 3,
+}
+
+
+@lru_cache(maxsize=1)
+def _resolve_app_icon_path() -> Optional[str]:
+    """アプリケーションアイコンのパスを取得（結果はキャッシュされる）"""
+    return next((path for path in _APP_ICON_CANDIDATES if os.path.exists(path)), None)
+
+
+@lru_cache(maxsize=1)
+def _app_icon() -> Optional[QIcon]:
+    """アプリケーションアイコンを取得（QApplication作成後に一度だけ読み込む）"""
+    icon_path = _resolve_app_icon_path()
+    return QIcon(icon_path) if icon_path else None
+
+
+class _NotifyTask(QRunnable):
+    """OS通知をスレッドプールで送信するタスク"""
+    
+    def __init__(self, func: Callable, *args):
+        super().__init__()
+        self._func = func
+        self._args = args
+    
+    def run(self):
+        self._func(*self._args)
+
 
 class NotificationManager(QObject):
     """通知管理クラス"""
     
+    # 短時間に続いた通知をまとめる待機時間（ミリ秒）と最大件数
+    COALESCE_INTERVAL_MS = 150
+    COALESCE_MAX_PENDING = 8
+    
+    # 同じ通知を重複とみなす時間（秒）と記録する最大件数
+    DEDUP_TTL = 2.0
+    DEDUP_MAX_KEYS = 16
+    
     # 通知シグナル
     notification_clicked = pyqtSignal(str)  # 通知ID
     
+    # OS通知に失敗した時のフォールバック要求（ワーカースレッドからGUIスレッドへ）
+    _fallback_requested = pyqtSignal(str, str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -28,6 +98,31 @@ class NotificationManager(QObject):
         self.is_windows = self.system == "windows"
         self.is_linux = self.system == "linux"
         
+        # OS通知の送信はスレッドプールで行い、GUIスレッドをブロックしない
+        self._pool = QThreadPool.globalInstance()
+        self._fallback_requested.connect(self._send_system_tray_notification)
+        
+        # Linux用の再生コマンドと音声ファイル（起動時に一度だけ探す）
+        self._linux_player: Optional[str] = None
+        self._linux_sound: Optional[str] = None
+        if self.is_linux:
+            self._linux_player, self._linux_sound = self._find_linux_player()
+        
+        # Windows用の通知・サウンドモジュール（初回使用時に読み込み、以降は再利用する）
+        # Falseは読み込みに失敗したことを表す
+        self._toaster = None
+        self._toaster_lock = threading.Lock()
+        self._winsound = None
+        
+        # 直近に送信した通知（(タイトル, メッセージ) -> 送信時刻）
+        self._recent_keys: "OrderedDict[tuple, float]" = OrderedDict()
+        
+        # 送信待ちの通知（一定時間内の通知はまとめて1件として送信する）
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_notifications)
+        
         # 通知設定
         self.enable_os_notifications = True
         self.enable_sound_notifications = False  # OS通知を使用する場合は独自音声は不要
@@ -38,8 +133,10 @@ class NotificationManager(QObject):
         self._setup_system_tray()
         
         # 通知履歴
-        self.notification_history = []
         self.max_history = 10
+        self.notification_history = deque(maxlen=self.max_history)
+        # 通知履歴の表示用テキスト（通知追加時に破棄し、表示時に再生成する）
+        self._history_text_cache: Optional[str] = None
     
     def _setup_system_tray(self):
         """システムトレイアイコンの設定"""
@@ -50,9 +147,9 @@ class NotificationManager(QObject):
             self.system_tray = QSystemTrayIcon()
             
             # アイコン設定（デフォルトアイコンまたはアプリアイコン）
-            icon_path = self._get_app_icon_path()
-            if icon_path and os.path.exists(icon_path):
-                self.system_tray.setIcon(QIcon(icon_path))
+            icon = _app_icon()
+            if icon is not None:
+                self.system_tray.setIcon(icon)
             
             # メニュー設定
             menu = QMenu()
@@ -85,21 +182,7 @@ class NotificationManager(QObject):
     
     def _get_app_icon_path(self) -> Optional[str]:
         """アプリケーションアイコンのパスを取得"""
-        # プロジェクトルートのアイコンファイルを探す
-        possible_paths = [
-            "icon.png",
-            "icon.ico",
-            "app_icon.png",
-            "app_icon.ico",
-            "assets/icon.png",
-            "assets/icon.ico"
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        
-        return None
+        return _resolve_app_icon_path()
     
     def _toggle_os_notifications(self, checked: bool):
         """OS通知の有効/無効を切り替え"""
@@ -116,13 +199,14 @@ class NotificationManager(QObject):
             return
         
         # 最新の5件を表示
-        recent_notifications = self.notification_history[-5:]
-        history_text = "\n".join([
-            f"• {notif['title']} ({notif['timestamp']})"
-            for notif in recent_notifications
-        ])
+        if self._history_text_cache is None:
+            recent_notifications = list(self.notification_history)[-5:]
+            self._history_text_cache = "\n".join([
+                f"• {notif['title']} ({notif['timestamp']})"
+                for notif in recent_notifications
+            ])
         
-        self._show_simple_notification("通知履歴", history_text)
+        self._show_simple_notification("通知履歴", self._history_text_cache)
     
     def notify_processing_completed(self, success: bool, message: str, details: str = ""):
         """
@@ -150,7 +234,20 @@ class NotificationManager(QObject):
     def _send_notification(self, title: str, message: str, details: str = "", 
                           notification_type: str = "info"):
         """通知を送信"""
-        import datetime
+        # 直近に同じ通知を送信済みの場合はスキップ
+        key = (title, message)
+        now = time.monotonic()
+        recent_keys = self._recent_keys
+        while recent_keys:
+            oldest_key, sent_at = next(iter(recent_keys.items()))
+            if now - sent_at <= self.DEDUP_TTL:
+                break
+            del recent_keys[oldest_key]
+        if key in recent_keys:
+            return
+        recent_keys[key] = now
+        if len(recent_keys) > self.DEDUP_MAX_KEYS:
+            recent_keys.popitem(last=False)
         
         # 通知履歴に追加
         notification = {
@@ -161,9 +258,39 @@ class NotificationManager(QObject):
             'timestamp': datetime.datetime.now().strftime("%H:%M:%S")
         }
         
+        # 上限を超えた古い通知はdequeが自動的に破棄する
         self.notification_history.append(notification)
-        if len(self.notification_history) > self.max_history:
-            self.notification_history.pop(0)
+        self._history_text_cache = None
+        
+        # 送信はまとめて行う（上限に達した場合は即座に送信）
+        self._pending.append(notification)
+        if len(self._pending) >= self.COALESCE_MAX_PENDING:
+            self._flush_notifications()
+        else:
+            self._flush_timer.start(self.COALESCE_INTERVAL_MS)
+    
+    def _flush_notifications(self):
+        """送信待ちの通知をまとめて送信"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        
+        pending, self._pending = self._pending, []
+        if len(pending) == 1:
+            notification = pending[0]
+            title = notification['title']
+            message = notification['message']
+            details = notification['details']
+        else:
+            # 最も重要度の高い通知（同じ重要度なら新しいもの）を代表として表示する
+            notification = max(
+                reversed(pending),
+                key=lambda item: NOTIFICATION_SEVERITY.get(item['type'], 0)
+            )
+            title = f"{len(pending)}件の通知"
+            message = notification['title']
+            details = ""
+        notification_type = notification['type']
         
         # OS通知を送信
         if self.enable_os_notifications:
@@ -175,75 +302,111 @@ class NotificationManager(QObject):
     
     def _send_os_notification(self, title: str, message: str, details: str, 
                              notification_type: str):
-        """OS通知を送信"""
+        """OS通知を送信（スレッドプールに登録してすぐに戻る）"""
+        if self.is_darwin and NSUserNotification is not None:  # macOS（pyobjc）
+            # プロセスを起動しないため、GUIスレッドでそのまま送信する
+            self._run_os_notification(self._send_macos_notification, title, message, details)
+            return
+        elif self.is_darwin:  # macOS
+            sender = self._send_macos_notification
+        elif self.is_windows:  # Windows
+            sender = self._send_windows_notification
+        elif self.is_linux:  # Linux
+            sender = self._send_linux_notification
+        else:
+            # システムトレイ通知（フォールバック）
+            self._send_system_tray_notification(title, message)
+            return
+        
+        self._pool.start(_NotifyTask(self._run_os_notification, sender, title, message, details))
+    
+    def _run_os_notification(self, sender: Callable, title: str, message: str, details: str):
+        """OS通知を送信（ワーカースレッドで実行）"""
         try:
-            if self.is_darwin:  # macOS
-                self._send_macos_notification(title, message, details)
-            elif self.is_windows:  # Windows
-                self._send_windows_notification(title, message, details)
-            elif self.is_linux:  # Linux
-                self._send_linux_notification(title, message, details)
-            else:
-                # システムトレイ通知（フォールバック）
-                self._send_system_tray_notification(title, message)
-                
+            sender(title, message, details)
         except Exception as e:
             print(f"OS通知の送信に失敗: {e}")
             # フォールバック: システムトレイ通知
-            self._send_system_tray_notification(title, message)
+            self._fallback_requested.emit(title, message)
     
     def _send_macos_notification(self, title: str, message: str, details: str):
         """macOS通知を送信"""
+        if NSUserNotification is not None:
+            notification = NSUserNotification.alloc().init()
+            notification.setTitle_(title)
+            notification.setInformativeText_(message)
+            notification.setSoundName_("Glass")
+            NSUserNotificationCenter.defaultUserNotificationCenter().deliverNotification_(notification)
+            return
+        
         try:
             # osascriptを使用してmacOS通知を送信（標準通知音付き）
-            script = f'''
-            display notification "{message}" with title "{title}" sound name "Glass"
-            '''
+            script = (
+                f'display notification "{self._escape_applescript(message)}" '
+                f'with title "{self._escape_applescript(title)}" sound name "Glass"'
+            )
             
-            subprocess.run(['osascript', '-e', script], 
-                         capture_output=True, text=True, check=True)
+            # 完了は待たない
+            subprocess.Popen(['osascript', '-e', script],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             print(f"macOS通知の送信に失敗: {e}")
             # フォールバック: システムトレイ通知
-            self._send_system_tray_notification(title, message)
+            self._fallback_requested.emit(title, message)
+    
+    @staticmethod
+    def _escape_applescript(text: str) -> str:
+        """AppleScriptの文字列リテラル用にエスケープ"""
+        return text.replace('\\', '\\\\').replace('"', '\\"')
     
     def _send_windows_notification(self, title: str, message: str, details: str):
         """Windows通知を送信"""
         try:
             # Windows 10/11のトースト通知
-            from win10toast import ToastNotifier
+            with self._toaster_lock:
+                if self._toaster is None:
+                    try:
+                        from win10toast import ToastNotifier
+                        self._toaster = ToastNotifier()
+                    except ImportError:
+                        self._toaster = False
+                
+                if self._toaster is False:
+                    # win10toastが利用できない場合はシステムトレイ通知
+                    self._fallback_requested.emit(title, message)
+                    return
+                
+                shown = self._toaster.show_toast(
+                    title,
+                    message,
+                    duration=5,
+                    threaded=True
+                )
             
-            toaster = ToastNotifier()
-            toaster.show_toast(
-                title,
-                message,
-                duration=5,
-                threaded=True
-            )
+            # 前のトーストを表示中の場合はシステムトレイ通知
+            if not shown:
+                self._fallback_requested.emit(title, message)
             
-        except ImportError:
-            # win10toastが利用できない場合はシステムトレイ通知
-            self._send_system_tray_notification(title, message)
         except Exception as e:
             print(f"Windows通知の送信に失敗: {e}")
-            self._send_system_tray_notification(title, message)
+            self._fallback_requested.emit(title, message)
     
     def _send_linux_notification(self, title: str, message: str, details: str):
         """Linux通知を送信"""
         try:
-            # notify-sendコマンドを使用
-            subprocess.run([
+            # notify-sendコマンドを使用（完了は待たない）
+            subprocess.Popen([
                 'notify-send',
                 title,
                 message,
                 '--urgency=normal',
                 '--app-name=PDFTranslate2md'
-            ], capture_output=True, check=True)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except OSError:
             # notify-sendが利用できない場合はシステムトレイ通知
-            self._send_system_tray_notification(title, message)
+            self._fallback_requested.emit(title, message)
     
     def _send_system_tray_notification(self, title: str, message: str):
         """システムトレイ通知を送信"""
@@ -298,36 +461,56 @@ class NotificationManager(QObject):
     
     def _play_windows_sound(self, notification_type: str):
         """Windowsで通知音を再生"""
-        try:
-            import winsound
-            
-            # Windowsのシステムサウンドを使用
-            if notification_type == "success":
-                winsound.MessageBeep(winsound.MB_ICONASTERISK)
-            elif notification_type == "error":
-                winsound.MessageBeep(winsound.MB_ICONHAND)
-            else:
-                winsound.MessageBeep(winsound.MB_ICONINFORMATION)
-                
-        except ImportError:
+        if self._winsound is None:
+            try:
+                import winsound
+                self._winsound = winsound
+            except ImportError:
+                self._winsound = False
+        
+        if self._winsound is False:
             # winsoundが利用できない場合はビープ音
             print('\a')
+            return
+        
+        # Windowsのシステムサウンドを使用
+        winsound = self._winsound
+        if notification_type == "success":
+            winsound.MessageBeep(winsound.MB_ICONASTERISK)
+        elif notification_type == "error":
+            winsound.MessageBeep(winsound.MB_ICONHAND)
+        else:
+            winsound.MessageBeep(winsound.MB_ICONINFORMATION)
     
     def _play_linux_sound(self, notification_type: str):
         """Linuxで通知音を再生"""
+        if self._linux_player is None:
+            # フォールバック: ビープ音
+            print('\a')
+            return
+        
         try:
-            # paplayコマンドを使用（PulseAudio）
-            subprocess.run(['paplay', '/usr/share/sounds/freedesktop/stereo/complete.oga'], 
-                         capture_output=True, check=True)
-            
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            try:
-                # aplayコマンドを使用（ALSA）
-                subprocess.run(['aplay', '/usr/share/sounds/sound-icons/glass-water-1.wav'], 
-                             capture_output=True, check=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                # フォールバック: ビープ音
-                print('\a')
+            # 再生の完了は待たない
+            subprocess.Popen([self._linux_player, self._linux_sound],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            # フォールバック: ビープ音
+            print('\a')
+    
+    @staticmethod
+    def _find_linux_player():
+        """Linuxで使用する再生コマンドと音声ファイルを探す"""
+        # paplayコマンドを使用（PulseAudio）
+        player = shutil.which('paplay')
+        if player:
+            return player, '/usr/share/sounds/freedesktop/stereo/complete.oga'
+        
+        # aplayコマンドを使用（ALSA）
+        player = shutil.which('aplay')
+        if player:
+            return player, '/usr/share/sounds/sound-icons/glass-water-1.wav'
+        
+        return None, None
     
     def set_sound_file(self, file_path: str):
         """カスタム音声ファイルを設定"""
@@ -356,6 +539,9 @@ class NotificationManager(QObject):
     
     def cleanup(self):
         """リソースのクリーンアップ"""
+        # 送信待ちの通知を送信
+        self._flush_notifications()
+        
         if self.system_tray:
             self.system_tray.hide()
             self.system_tray.deleteLater() 
\ No newline at end of file
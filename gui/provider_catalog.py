@@ -0,0 +1,18 @@
+"""
+GUIで選択できるプロバイダーとモデルの一覧
+起動時にも読み込むため、PDF処理・翻訳モジュールには依存しない
+"""
+
+# 利用可能なプロバイダー（表示順）
+AVAILABLE_PROVIDERS = (
+    {'id': 'gemini', 'name': 'Google Gemini'},
+    {'id': 'openai', 'name': 'OpenAI GPT'},
+    {'id': 'anthropic', 'name': 'Anthropic Claude'}
+)
+
+# プロバイダー別の利用可能なモデル
+AVAILABLE_MODELS = {
+    'gemini': ('gemini-2.5-flash-preview-04-17',),
+    'openai': ('gpt-4.1', 'gpt-4.1-mini'),
+    'anthropic': ('claude-3-7-sonnet',)
+}
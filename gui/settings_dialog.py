@@ -6,7 +6,7 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
                              QLabel, QComboBox, QPushButton, QLineEdit, 
                              QCheckBox, QGroupBox, QDialogButtonBox, QWidget,
                              QFileDialog)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSignalBlocker
 
 
 class SettingsDialog(QDialog):
@@ -18,6 +18,9 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         self.resize(500, 400)
         
+        # 通知マネージャー（親ウィンドウが持つ場合のみ。テスト通知で使用）
+        self._nm = getattr(parent, 'notification_manager', None)
+        
         layout = QVBoxLayout()
         
         # タブウィジェット
@@ -152,21 +155,21 @@ class SettingsDialog(QDialog):
     
     def _test_success_notification(self):
         """成功通知をテスト"""
-        if hasattr(self.parent(), 'notification_manager'):
-            self.parent().notification_manager.notify_processing_completed(
+        if self._nm is not None:
+            self._nm.notify_processing_completed(
                 True, "翻訳処理が正常に完了しました", "テスト用の通知です"
             )
     
     def _test_error_notification(self):
         """エラー通知をテスト"""
-        if hasattr(self.parent(), 'notification_manager'):
-            self.parent().notification_manager.notify_processing_completed(
+        if self._nm is not None:
+            self._nm.notify_processing_completed(
                 False, "処理中にエラーが発生しました", "テスト用の通知です"
             )
     
     def _show_notification_history(self):
         """通知履歴を表示"""
-        if hasattr(self.parent(), 'notification_manager'):
+        if self._nm is not None:
             # 通知履歴を表示する処理はNotificationManager内で実装済み
             pass
     
@@ -182,16 +185,15 @@ class SettingsDialog(QDialog):
     
     def load_settings(self, notification_settings: dict):
         """設定を読み込み"""
-        self.enable_os_notifications.setChecked(notification_settings.get('enable_os_notifications', True))
-        self.enable_sound_notifications.setChecked(notification_settings.get('enable_sound_notifications', False))
+        # OS通知の状態に応じた独自音声通知の状態を先に決め、各ウィジェットには最終値を一度だけ設定する
+        os_enabled = notification_settings.get('enable_os_notifications', True)
+        sound_enabled = not os_enabled and notification_settings.get('enable_sound_notifications', False)
+        
+        with QSignalBlocker(self.enable_os_notifications):
+            self.enable_os_notifications.setChecked(os_enabled)
+        self.enable_sound_notifications.setChecked(sound_enabled)
+        self.enable_sound_notifications.setEnabled(not os_enabled)
         self.sound_file_edit.setText(notification_settings.get('sound_file_path', ''))
-        
-        # OS通知の状態に応じて独自音声通知の有効/無効を設定
-        if self.enable_os_notifications.isChecked():
-            self.enable_sound_notifications.setChecked(False)
-            self.enable_sound_notifications.setEnabled(False)
-        else:
-            self.enable_sound_notifications.setEnabled(True)
     
     def get_notification_settings(self) -> dict:
         """通知設定を取得"""
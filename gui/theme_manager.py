@@ -3,11 +3,91 @@
 ダークモード/ライトモードの自動切り替えとスタイル管理
 """
 
+from __future__ import annotations
+
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from PyQt5.QtGui import QPalette, QColor
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Tuple
+import functools
 import sys
+import time
+
+
+# ボタンの種類ごとの（背景色, ホバー時の背景色）のキー
+BUTTON_STYLE_MAP = {
+    "primary": ("button_primary", "button_primary_hover"),
+    "success": ("button_success", "button_success_hover"),
+    "danger": ("button_danger", "button_danger_hover"),
+    "secondary": ("button_secondary", "button_secondary_hover"),
+    "info": ("button_info", "button_info_hover"),
+}
+
+# フレームの種類ごとのスタイルシートのテンプレート（selectorと色のキーで置換する）
+FRAME_STYLE_TEMPLATES = {
+    "drop_area": """
+        {selector} {{
+            border: 2px dashed {drop_area_border};
+            border-radius: 10px;
+            background-color: {drop_area_bg};
+        }}
+        {selector}:hover {{
+            border-color: {drop_area_border_hover};
+            background-color: {drop_area_hover};
+        }}
+    """,
+    "drop_area_hover": """
+        {selector} {{
+            border: 2px solid {drop_area_border_hover};
+            border-radius: 10px;
+            background-color: {drop_area_hover};
+        }}
+    """,
+    "drop_area_selected": """
+        {selector} {{
+            border: 2px solid {drop_area_selected_border};
+            border-radius: 10px;
+            background-color: {drop_area_selected};
+        }}
+    """,
+    "default": """
+        {selector} {{
+            background-color: {surface};
+            border: 1px solid {border};
+            border-radius: 8px;
+        }}
+    """,
+}
+
+# プログレスバーの種類ごとのチャンク色のキー
+PROGRESS_CHUNK_MAP = {
+    "overall": "progress_chunk",
+    "file": "progress_chunk_file",
+}
+
+# 色文字列ごとのQColor（get_qcolorが使用）
+_QCOLOR_CACHE: dict[str, QColor] = {}
+
+
+def _cached_style(method: Callable[..., str]) -> Callable[..., str]:
+    """
+    スタイル生成メソッドの結果をテーマ・引数ごとにキャッシュするデコレーター
+    
+    キーに現在のテーマを含めるため、テーマ切り替え時の無効化は不要
+    """
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, self._current_theme, args, tuple(sorted(kwargs.items())))
+        style = self._style_cache.get(key)
+        if style is None:
+            style = method(self, *args, **kwargs)
+            self._style_cache[key] = style
+        return style
+    
+    return wrapper
 
 
 class ThemeManager(QObject):
@@ -16,22 +96,50 @@ class ThemeManager(QObject):
     システムのダークモード設定を検出し、アプリケーション全体のテーマを管理
     """
     
+    # QApplicationがない場合のみ使用するポーリング間隔（ミリ秒）
+    FALLBACK_POLL_INTERVAL_MS = 60000
+    
+    # システムテーマの検出結果を再利用する時間（秒）
+    DETECT_CACHE_TTL = 1.0
+    
     # シグナル
     theme_changed = pyqtSignal(str)  # テーマが変更された時
     
     def __init__(self):
         super().__init__()
         
+        # システムテーマの検出結果のキャッシュ（検出時刻, テーマ）
+        self._detect_cache: Optional[Tuple[float, str]] = None
+        
         self._current_theme = self._detect_system_theme()
         self._colors = self._initialize_colors()
         
-        # システムテーマの変更を監視するタイマー
-        self._monitor_timer = QTimer()
-        self._monitor_timer.timeout.connect(self._check_theme_change)
-        self._monitor_timer.start(5000)  # 5秒間隔でチェック
+        # 生成済みスタイルシートのキャッシュ（_cached_styleが使用）
+        self._style_cache: dict[tuple, str] = {}
+        
+        # システムテーマの変更を監視する
+        # OSの外観が変わるとQtがアプリケーションのパレットを更新するため、その通知を受けて判定する
+        self._monitor_timer: Optional[QTimer] = None
+        app = QApplication.instance()
+        if app is not None:
+            app.paletteChanged.connect(self._on_palette_changed)
+        else:
+            self._monitor_timer = QTimer()
+            self._monitor_timer.timeout.connect(self._check_theme_change)
+            self._monitor_timer.start(self.FALLBACK_POLL_INTERVAL_MS)
     
     def _detect_system_theme(self) -> str:
-        """システムのテーマを検出"""
+        """システムのテーマを検出（短時間の再問い合わせにはキャッシュを返す）"""
+        now = time.monotonic()
+        if self._detect_cache is not None and now - self._detect_cache[0] < self.DETECT_CACHE_TTL:
+            return self._detect_cache[1]
+        
+        theme = self._query_system_theme()
+        self._detect_cache = (now, theme)
+        return theme
+    
+    def _query_system_theme(self) -> str:
+        """システムのテーマを問い合わせる"""
         try:
             app = QApplication.instance()
             if app:
@@ -39,13 +147,20 @@ class ThemeManager(QObject):
                 # ウィンドウの背景色で判定
                 window_color = palette.color(QPalette.Window)
                 # 明度が128未満の場合はダークテーマとみなす
-                brightness = (window_color.red() + window_color.green() + window_color.blue()) / 3
-                return "dark" if brightness < 128 else "light"
+                return "dark" if window_color.lightness() < 128 else "light"
         except Exception:
             pass
         
         # macOSの場合の追加チェック
         if sys.platform == "darwin":
+            try:
+                # pyobjcが利用可能ならプロセスを起動せずに設定を読む
+                from Foundation import NSUserDefaults
+                style = NSUserDefaults.standardUserDefaults().stringForKey_("AppleInterfaceStyle")
+                return "dark" if style == "Dark" else "light"
+            except ImportError:
+                pass
+            
             try:
                 import subprocess
                 result = subprocess.run(
@@ -60,9 +175,9 @@ class ThemeManager(QObject):
         
         return "light"  # デフォルトはライトテーマ
     
-    def _initialize_colors(self) -> Dict[str, Dict[str, str]]:
-        """カラーパレットを初期化"""
-        return {
+    def _initialize_colors(self) -> dict[str, Mapping[str, str]]:
+        """カラーパレットを初期化（読み取り専用のビューとして共有する）"""
+        palettes = {
             "light": {
                 # 基本色
                 "background": "#ffffff",
@@ -184,6 +299,17 @@ class ThemeManager(QObject):
                 "history_stats_border": "#555555",
             }
         }
+        # テーマ間で共通の色文字列は同一オブジェクトとして共有する
+        return {
+            theme: MappingProxyType({key: sys.intern(value) for key, value in colors.items()})
+            for theme, colors in palettes.items()
+        }
+    
+    def _on_palette_changed(self):
+        """アプリケーションのパレットが変更された時"""
+        # パレットが変わったため、キャッシュを使わずに判定し直す
+        self._detect_cache = None
+        self._check_theme_change()
     
     def _check_theme_change(self):
         """テーマの変更をチェック"""
@@ -204,83 +330,71 @@ class ThemeManager(QObject):
         """色を取得"""
         return self._colors[self._current_theme].get(key, "#000000")
     
-    def get_colors(self) -> Dict[str, str]:
-        """現在のテーマの全色を取得"""
-        return self._colors[self._current_theme].copy()
+    def get_qcolor(self, key: str) -> QColor:
+        """色をQColorとして取得（同じ色のQColorは共有する。変更しないこと）"""
+        hex_color = self.get_color(key)
+        color = _QCOLOR_CACHE.get(hex_color)
+        if color is None:
+            color = QColor(hex_color)
+            _QCOLOR_CACHE[hex_color] = color
+        return color
     
-    def generate_button_style(self, button_type: str = "primary") -> str:
-        """ボタンのスタイルを生成"""
-        colors = self.get_colors()
-        
-        style_map = {
-            "primary": ("button_primary", "button_primary_hover"),
-            "success": ("button_success", "button_success_hover"),
-            "danger": ("button_danger", "button_danger_hover"),
-            "secondary": ("button_secondary", "button_secondary_hover"),
-            "info": ("button_info", "button_info_hover"),
-        }
-        
-        if button_type not in style_map:
-            button_type = "primary"
+    def get_colors(self) -> Mapping[str, str]:
+        """現在のテーマの全色を取得（読み取り専用。変更する場合はdict()でコピーすること）"""
+        return self._colors[self._current_theme]
+    
+    @_cached_style
+    def generate_button_style(self, button_type: str = "primary", padding: str = "8px 16px",
+                              font_size: Optional[str] = None, selector: str = "QPushButton") -> str:
+        """
+        ボタンのスタイルを生成
         
-        bg_key, hover_key = style_map[button_type]
+        Args:
+            button_type: ボタンの種類（primary, success, danger, secondary, info）
+            padding: ボタンの内側余白
+            font_size: フォントサイズ（省略時は指定しない）
+            selector: 適用先のセレクター（親ウィジェットにまとめて設定する場合に指定）
+        """
+        colors = self.get_colors()
+        font_size_rule = f" font-size: {font_size};" if font_size else ""
+        bg_key, hover_key = BUTTON_STYLE_MAP.get(button_type, BUTTON_STYLE_MAP["primary"])
         
         return f"""
-            QPushButton {{
+            {selector} {{
                 background-color: {colors[bg_key]};
                 color: {colors['text_primary']};
                 border: none;
                 border-radius: 4px;
-                padding: 8px 16px;
+                padding: {padding};{font_size_rule}
                 font-weight: bold;
             }}
-            QPushButton:hover:enabled {{
+            {selector}:hover:enabled {{
                 background-color: {colors[hover_key]};
             }}
-            QPushButton:disabled {{
+            {selector}:disabled {{
                 background-color: {colors['text_disabled']};
                 color: {colors['text_secondary']};
             }}
         """
     
-    def generate_frame_style(self, frame_type: str = "default") -> str:
-        """フレームのスタイルを生成"""
-        colors = self.get_colors()
+    @_cached_style
+    def generate_frame_style(self, frame_type: str = "default", selector: str = "QFrame") -> str:
+        """
+        フレームのスタイルを生成
         
-        if frame_type == "drop_area":
-            return f"""
-                QFrame {{
-                    border: 2px dashed {colors['drop_area_border']};
-                    border-radius: 10px;
-                    background-color: {colors['drop_area_bg']};
-                }}
-                QFrame:hover {{
-                    border-color: {colors['drop_area_border_hover']};
-                    background-color: {colors['drop_area_hover']};
-                }}
-            """
-        elif frame_type == "drop_area_selected":
-            return f"""
-                QFrame {{
-                    border: 2px solid {colors['drop_area_selected_border']};
-                    border-radius: 10px;
-                    background-color: {colors['drop_area_selected']};
-                }}
-            """
-        else:  # default
-            return f"""
-                QFrame {{
-                    background-color: {colors['surface']};
-                    border: 1px solid {colors['border']};
-                    border-radius: 8px;
-                }}
-            """
+        Args:
+            frame_type: フレームの種類（default, drop_area, drop_area_hover, drop_area_selected）
+            selector: 適用先のセレクター（子ウィジェットに波及させない場合に指定）
+        """
+        template = FRAME_STYLE_TEMPLATES.get(frame_type, FRAME_STYLE_TEMPLATES["default"])
+        return template.format(selector=selector, **self.get_colors())
     
+    @_cached_style
     def generate_progress_style(self, progress_type: str = "overall") -> str:
         """プログレスバーのスタイルを生成"""
         colors = self.get_colors()
         
-        chunk_color = colors["progress_chunk_file"] if progress_type == "file" else colors["progress_chunk"]
+        chunk_color = colors[PROGRESS_CHUNK_MAP.get(progress_type, "progress_chunk")]
         
         return f"""
             QProgressBar {{
@@ -297,12 +411,13 @@ class ThemeManager(QObject):
             }}
         """
     
+    @_cached_style
     def generate_log_style(self) -> str:
         """ログのスタイルを生成"""
         colors = self.get_colors()
         
         return f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {colors['log_bg']};
                 border: 1px solid {colors['log_border']};
                 border-radius: 4px;
@@ -313,38 +428,50 @@ class ThemeManager(QObject):
             }}
         """
     
+    @_cached_style
     def generate_list_style(self) -> str:
         """リストのスタイルを生成"""
         colors = self.get_colors()
         
         return f"""
-            QListWidget {{
+            QListView {{
                 border: 1px solid {colors['history_border']};
                 border-radius: 6px;
                 background-color: {colors['history_item_bg']};
                 alternate-background-color: {colors['surface']};
                 color: {colors['text_primary']};
             }}
-            QListWidget::item {{
+            QListView::item {{
                 border-bottom: 1px solid {colors['border']};
                 padding: 4px;
             }}
-            QListWidget::item:selected {{
+            QListView::item:selected {{
                 background-color: {colors['history_item_selected']};
                 color: {colors['text_primary']};
             }}
-            QListWidget::item:hover {{
+            QListView::item:hover {{
                 background-color: {colors['history_item_hover']};
             }}
         """
 
 
 # グローバルテーママネージャーのインスタンス
-_theme_manager = None
+# 初回アクセス時に__getattr__（PEP 562）で生成してモジュール属性に束縛するため、
+# 以降の `from gui.theme_manager import theme_manager` は属性の読み出しのみとなる
+# （QApplicationの生成後にアクセスすること）
+
+def __getattr__(name):
+    """theme_managerへの初回アクセス時にインスタンスを生成する"""
+    if name == "theme_manager":
+        manager = ThemeManager()
+        globals()[name] = manager
+        return manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_theme_manager() -> ThemeManager:
-    """テーママネージャーのシングルトンインスタンスを取得"""
-    global _theme_manager
-    if _theme_manager is None:
-        _theme_manager = ThemeManager()
-    return _theme_manager
\ No newline at end of file
+    """テーママネージャーのシングルトンインスタンスを取得（後方互換用）"""
+    manager = globals().get("theme_manager")
+    if manager is None:
+        manager = __getattr__("theme_manager")
+    return manager
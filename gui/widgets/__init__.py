@@ -5,12 +5,13 @@ GUI用のカスタムウィジェットをまとめたパッケージ
 
 from .file_drop_widget import FileDropWidget
 from .progress_widget import ProgressWidget, LogLevel
-from .history_widget import HistoryWidget, HistoryItemWidget
+from .history_widget import HistoryWidget, HistoryListModel, HistoryItemDelegate
 
 __all__ = [
     'FileDropWidget',
     'ProgressWidget', 
     'LogLevel',
     'HistoryWidget',
-    'HistoryItemWidget'
+    'HistoryListModel',
+    'HistoryItemDelegate'
 ]
\ No newline at end of file
@@ -3,12 +3,39 @@
 """
 
 import os
+import stat
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QFileDialog, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QPushButton, QFileDialog, QFrame, QMenu, QAction)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QFileSystemWatcher
 from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QPalette, QFont
 
 
+@lru_cache(maxsize=None)
+def _make_font(point_size: int, bold: bool = False) -> QFont:
+    """フォントを取得（同じ設定のフォントはインスタンス間で共有する）"""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=64)
+def _dir_contains_pdf(path: str, mtime_ns: int) -> bool:
+    """
+    フォルダにPDFファイルが含まれているかチェック（最初の1件で打ち切る）
+    
+    フォルダの更新時刻をキーに含め、ファイルが追加・削除された場合は再チェックする
+    """
+    with os.scandir(path) as entries:
+        return any(
+            not entry.name.startswith('.') and entry.name.lower().endswith('.pdf') and entry.is_file()
+            for entry in entries
+        )
+
+
 class FileDropWidget(QFrame):
     """
     ファイル・フォルダのドラッグ&ドロップに対応したウィジェット
@@ -17,13 +44,27 @@ class FileDropWidget(QFrame):
     # シグナル
     path_selected = pyqtSignal(str)  # パスが選択された時
     
+    # 枠のスタイルの適用先（子のQLabelもQFrameのため、オブジェクト名で限定する）
+    FRAME_SELECTOR = "QFrame#fileDropArea"
+    
+    # パス表示用テキストのキャッシュ件数
+    DISPLAY_CACHE_SIZE = 16
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.selected_path = ""
+        self._path_is_file = False  # 選択中のパスがファイルかどうか（選択時に判定）
         self.accept_files = True
         self.accept_folders = True
         self.file_filter = "PDFファイル (*.pdf)"
+        self.theme_manager = None  # apply_themeで設定
+        self._display_cache: "OrderedDict[str, str]" = OrderedDict()  # パス -> 表示用テキスト
+        
+        # 選択中のパスを監視し、外部で変更された時だけ種別を判定し直す
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_watched_path_changed)
+        self._watcher.directoryChanged.connect(self._on_watched_path_changed)
         
         self._setup_ui()
         self._setup_drag_drop()
@@ -31,7 +72,12 @@ class FileDropWidget(QFrame):
     def _setup_ui(self):
         """UIの設定"""
         self.setFrameStyle(QFrame.StyledPanel)
-        # スタイルはテーマ適用時に設定
+        # スタイルはテーマ適用時にこのウィジェットへまとめて設定（子はオブジェクト名で指定）
+        self.setObjectName("fileDropArea")
+        # 状態ごとのスタイルシート（apply_themeで生成し、イベント時は切り替えるだけにする）
+        self._style_idle = ""
+        self._style_selected = ""
+        self._style_hover = ""
         
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignCenter)
@@ -39,26 +85,24 @@ class FileDropWidget(QFrame):
         
         # アイコンラベル
         self.icon_label = QLabel("📁")
+        self.icon_label.setObjectName("iconLabel")
         self.icon_label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(32)
-        self.icon_label.setFont(font)
+        self.icon_label.setFont(_make_font(32))
         
         # メインメッセージ
         self.main_label = QLabel("PDFファイルまたはフォルダをここにドラッグ&ドロップ")
+        self.main_label.setObjectName("mainLabel")
         self.main_label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(12)
-        font.setBold(True)
-        self.main_label.setFont(font)
+        self.main_label.setFont(_make_font(12, bold=True))
         
         # サブメッセージ
         self.sub_label = QLabel("または下のボタンをクリックして選択")
+        self.sub_label.setObjectName("subLabel")
         self.sub_label.setAlignment(Qt.AlignCenter)
-        self.sub_label.setStyleSheet("color: #666666;")
         
         # 選択されたパス表示
         self.path_label = QLabel("")
+        self.path_label.setObjectName("pathLabel")
         self.path_label.setAlignment(Qt.AlignCenter)
         # スタイルはテーマ適用時に設定
         self.path_label.hide()
@@ -69,11 +113,13 @@ class FileDropWidget(QFrame):
         
         # ファイル/フォルダ選択ボタン（統一）
         self.select_button = QPushButton("📁 ファイル/フォルダ選択")
+        self.select_button.setObjectName("selectButton")
         self.select_button.clicked.connect(self._select_file_or_folder)
         # スタイルはテーマ適用時に設定
         
         # クリアボタン
         self.clear_button = QPushButton("🗑️ クリア")
+        self.clear_button.setObjectName("clearButton")
         self.clear_button.clicked.connect(self._clear_selection)
         # スタイルはテーマ適用時に設定
         self.clear_button.hide()
@@ -126,25 +172,67 @@ class FileDropWidget(QFrame):
     
     def set_selected_path(self, path: str):
         """パスを設定"""
-        if path and os.path.exists(path):
-            self.selected_path = path
+        # 同じパスの再設定では表示更新・シグナル送信を行わない
+        if path == self.selected_path:
+            return
+        
+        # 空のパスは選択の解除として扱う
+        if not path:
+            self._clear_selection()
+            return
+        
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            return
+        
+        self._select_path(path, path_stat)
+    
+    def _select_path(self, path: str, path_stat: os.stat_result):
+        """取得済みのstat結果を使ってパスを設定"""
+        self.selected_path = path
+        self._path_is_file = stat.S_ISREG(path_stat.st_mode)
+        self._watch_path(path)
+        self._update_display()
+        self.path_selected.emit(path)
+    
+    def _watch_path(self, path: str):
+        """監視対象を指定のパスに切り替える（空文字の場合は監視を解除）"""
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        if path:
+            self._watcher.addPath(path)
+    
+    def _on_watched_path_changed(self, path: str):
+        """選択中のパスが外部で変更された時"""
+        if path != self.selected_path:
+            return
+        
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            # 削除された場合は選択を維持し、処理開始時の検証に任せる
+            return
+        
+        # 置き換えで監視が外れた場合は再登録する
+        if path not in self._watcher.files() and path not in self._watcher.directories():
+            self._watcher.addPath(path)
+        
+        is_file = stat.S_ISREG(path_stat.st_mode)
+        if is_file != self._path_is_file:
+            self._path_is_file = is_file
             self._update_display()
-            self.path_selected.emit(path)
     
     def _update_display(self):
         """表示を更新"""
         if self.selected_path:
-            # パスを短縮表示
-            display_path = self.selected_path
-            if len(display_path) > 60:
-                display_path = "..." + display_path[-57:]
-            
-            self.path_label.setText(f"選択中: {display_path}")
+            self.path_label.setText(self._get_display_text(self.selected_path))
             self.path_label.show()
             self.clear_button.show()
             
             # アイコンとメッセージを更新
-            if os.path.isfile(self.selected_path):
+            if self._path_is_file:
                 self.icon_label.setText("📄")
                 self.main_label.setText("ファイルが選択されています")
             else:
@@ -153,9 +241,7 @@ class FileDropWidget(QFrame):
             
             self.sub_label.setText("別のファイル/フォルダを選択するか、クリアしてください")
             
-            # スタイルはテーマ適用時に設定
-            if hasattr(self, 'theme_manager'):
-                self.setStyleSheet(self.theme_manager.generate_frame_style("drop_area_selected"))
+            self._apply_state_style()
         else:
             self.path_label.hide()
             self.clear_button.hide()
@@ -165,14 +251,26 @@ class FileDropWidget(QFrame):
             self.main_label.setText("PDFファイルまたはフォルダをここにドラッグ&ドロップ")
             self.sub_label.setText("または下のボタンをクリックして選択")
             
-            # スタイルはテーマ適用時に設定
-            if hasattr(self, 'theme_manager'):
-                self.setStyleSheet(self.theme_manager.generate_frame_style("drop_area"))
+            self._apply_state_style()
+    
+    def _get_display_text(self, path: str) -> str:
+        """パス表示用のテキストを取得（最近のパスはキャッシュを再利用する）"""
+        text = self._display_cache.get(path)
+        if text is not None:
+            self._display_cache.move_to_end(path)
+            return text
+        
+        # パスを短縮表示
+        display_path = ("..." + path[-57:]) if len(path) > 60 else path
+        text = f"選択中: {display_path}"
+        
+        self._display_cache[path] = text
+        if len(self._display_cache) > self.DISPLAY_CACHE_SIZE:
+            self._display_cache.popitem(last=False)
+        return text
     
     def _select_file_or_folder(self):
         """ファイル/フォルダ選択ダイアログを開く（統一）"""
-        from PyQt5.QtWidgets import QMenu, QAction
-        
         # メニューを作成してファイルとフォルダの選択肢を提供
         menu = QMenu(self)
         
@@ -215,6 +313,7 @@ class FileDropWidget(QFrame):
     def _clear_selection(self):
         """選択をクリア"""
         self.selected_path = ""
+        self._watch_path("")
         self._update_display()
         self.path_selected.emit("")
     
@@ -225,23 +324,15 @@ class FileDropWidget(QFrame):
             event.acceptProposedAction()
             
             # ホバー時のスタイル
-            if hasattr(self, 'theme_manager'):
-                colors = self.theme_manager.get_colors()
-                hover_style = f"""
-                    QFrame {{
-                        border: 2px solid {colors['drop_area_border_hover']};
-                        border-radius: 10px;
-                        background-color: {colors['drop_area_hover']};
-                    }}
-                """
-                self.setStyleSheet(hover_style)
+            if self._style_hover:
+                self.setStyleSheet(self._style_hover)
         else:
             event.ignore()
     
     def dragLeaveEvent(self, event):
         """ドラッグリーブ時の処理"""
-        # 元のスタイルに戻す
-        self._update_display()
+        # 元のスタイルに戻す（表示内容は変わらないためスタイルのみ切り替える）
+        self._apply_state_style()
     
     def dropEvent(self, event: QDropEvent):
         """ドロップ時の処理"""
@@ -251,15 +342,21 @@ class FileDropWidget(QFrame):
                 # 最初のURLを取得
                 file_path = urls[0].toLocalFile()
                 
-                # ファイル・フォルダの検証
-                if os.path.exists(file_path):
-                    is_file = os.path.isfile(file_path)
-                    is_folder = os.path.isdir(file_path)
+                # ファイル・フォルダの検証（statは1回だけ行い、以降はその結果を使う）
+                try:
+                    path_stat = os.stat(file_path)
+                except OSError:
+                    path_stat = None
+                
+                if path_stat is not None:
+                    is_file = stat.S_ISREG(path_stat.st_mode)
+                    is_folder = stat.S_ISDIR(path_stat.st_mode)
                     
                     if (is_file and self.accept_files) or (is_folder and self.accept_folders):
                         # PDFファイルまたはPDFファイルを含むフォルダかチェック
-                        if self._is_valid_path(file_path):
-                            self.set_selected_path(file_path)
+                        if self._is_valid_path(file_path, path_stat):
+                            if file_path != self.selected_path:
+                                self._select_path(file_path, path_stat)
                             event.acceptProposedAction()
                         else:
                             self._show_error("PDFファイルまたはPDFファイルを含むフォルダを選択してください")
@@ -268,19 +365,26 @@ class FileDropWidget(QFrame):
                 else:
                     self._show_error("無効なパスです")
         
-        # スタイルを戻す
-        self._update_display()
+        # スタイルを戻す（表示内容はset_selected_pathで更新済み）
+        self._apply_state_style()
     
-    def _is_valid_path(self, path: str) -> bool:
-        """パスが有効かどうかチェック"""
-        if os.path.isfile(path):
+    def _is_valid_path(self, path: str, path_stat: Optional[os.stat_result] = None) -> bool:
+        """パスが有効かどうかチェック（取得済みのstat結果があれば再利用する）"""
+        if path_stat is None:
+            try:
+                path_stat = os.stat(path)
+            except OSError:
+                return False
+        
+        if stat.S_ISREG(path_stat.st_mode):
             # ファイルの場合、PDFファイルかチェック
             return path.lower().endswith('.pdf')
-        elif os.path.isdir(path):
+        elif stat.S_ISDIR(path_stat.st_mode):
             # フォルダの場合、PDFファイルが含まれているかチェック
-            import glob
-            pdf_files = glob.glob(os.path.join(path, "*.pdf"))
-            return len(pdf_files) > 0
+            try:
+                return _dir_contains_pdf(path, path_stat.st_mtime_ns)
+            except OSError:
+                return False
         return False
     
     def _show_error(self, message: str):
@@ -291,7 +395,6 @@ class FileDropWidget(QFrame):
         self.main_label.setStyleSheet("color: #dc3545;")
         
         # 3秒後に元に戻す
-        from PyQt5.QtCore import QTimer
         QTimer.singleShot(3000, lambda: self._reset_error_message(original_text))
     
     def _reset_error_message(self, original_text: str):
@@ -299,20 +402,20 @@ class FileDropWidget(QFrame):
         self.main_label.setText(original_text)
         self.main_label.setStyleSheet("")
     
+    def _apply_state_style(self):
+        """選択状態に応じたスタイルを設定（テーマ適用前は何もしない）"""
+        style = self._style_selected if self.selected_path else self._style_idle
+        if style:
+            self.setStyleSheet(style)
+    
     def apply_theme(self, theme_manager):
         """テーマを適用"""
         self.theme_manager = theme_manager
         colors = theme_manager.get_colors()
         
-        # 基本フレームスタイル
-        if self.selected_path:
-            self.setStyleSheet(theme_manager.generate_frame_style("drop_area_selected"))
-        else:
-            self.setStyleSheet(theme_manager.generate_frame_style("drop_area"))
-        
-        # 選択されたパス表示のスタイル
-        path_style = f"""
-            QLabel {{
+        # 子ウィジェットのスタイル（再ポリッシュを1回にするため、このウィジェットにまとめて設定する）
+        children_style = f"""
+            QLabel#pathLabel {{
                 color: {colors['button_primary']};
                 font-weight: bold;
                 background-color: {colors['surface']};
@@ -320,15 +423,30 @@ class FileDropWidget(QFrame):
                 border-radius: 5px;
                 border: 1px solid {colors['button_primary']};
             }}
-        """
-        self.path_label.setStyleSheet(path_style)
-
-        # --- ここからラベルのボーダー・ホバーを明示的にリセット ---
-        self.icon_label.setStyleSheet("color: {}; background: none; border: none;".format(colors['text_primary']))
-        self.main_label.setStyleSheet("color: {}; background: none; border: none; font-weight: bold;".format(colors['text_primary']))
-        self.sub_label.setStyleSheet("color: {}; background: none; border: none;".format(colors['text_secondary']))
-        # --- ここまで ---
-        
-        # ボタンのスタイル
-        self.select_button.setStyleSheet(theme_manager.generate_button_style("primary"))
-        self.clear_button.setStyleSheet(theme_manager.generate_button_style("danger"))
\ No newline at end of file
+            QLabel#iconLabel {{
+                color: {colors['text_primary']};
+                background: none;
+                border: none;
+            }}
+            QLabel#mainLabel {{
+                color: {colors['text_primary']};
+                background: none;
+                border: none;
+                font-weight: bold;
+            }}
+            QLabel#subLabel {{
+                color: {colors['text_secondary']};
+                background: none;
+                border: none;
+            }}
+        """ + theme_manager.generate_button_style(
+            "primary", selector="QPushButton#selectButton"
+        ) + theme_manager.generate_button_style(
+            "danger", selector="QPushButton#clearButton"
+        )
+        
+        # 枠の状態ごとのスタイルシートを生成
+        self._style_idle = theme_manager.generate_frame_style("drop_area", self.FRAME_SELECTOR) + children_style
+        self._style_selected = theme_manager.generate_frame_style("drop_area_selected", self.FRAME_SELECTOR) + children_style
+        self._style_hover = theme_manager.generate_frame_style("drop_area_hover", self.FRAME_SELECTOR) + children_style
+        self._apply_state_style()
@@ -3,139 +3,347 @@
 処理履歴の表示、選択、削除機能を提供
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, 
-                             QListWidgetItem, QPushButton, QLabel, QFrame,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView,
+                             QStyledItemDelegate, QStyleOptionViewItem, QStyle,
+                             QApplication, QPushButton, QLabel, QFrame,
                              QMessageBox, QMenu, QInputDialog, QFileDialog)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QIcon
-from typing import List, Optional
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QAbstractListModel, QModelIndex, QRect, QSize,
+                          QSignalBlocker)
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QIcon, QPalette
+from functools import lru_cache
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple
 import os
+import time
 from datetime import datetime
 
 from gui.history_manager import HistoryManager, ProcessingHistory
 
 
-class HistoryItemWidget(QWidget):
-    """履歴項目の表示ウィジェット"""
+@lru_cache(maxsize=1024)
+def _detail_texts(input_path: str, provider: str, model: str, output_dir: str) -> Tuple[str, str, str]:
+    """
+    履歴項目の入力パス・プロバイダー・出力先の表示文字列を生成
+    
+    いずれも履歴の作成後に変わらない項目のため、値の組ごとに一度だけ整形する
+    """
+    return (
+        f"📁 入力: {input_path}",
+        f"🔧 {provider} / {model}",
+        f"📤 出力: {output_dir}",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """ISO形式の日時文字列を解析（同じ文字列は一度だけ解析する）"""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=1024)
+def _bucket_time_diff(last_used: str, minute_bucket: int) -> str:
+    """
+    時間差を人間にわかりやすい形式で表示
+    
+    現在時刻を分単位のバケットで受け取るため、同じ分の間の再描画ではキャッシュを返す
+    """
+    diff = datetime.fromtimestamp(minute_bucket * 60) - _parse_iso(last_used)
+    
+    # バケットの開始時刻より後に使用された履歴は差が負になるため、「たった今」として扱う
+    if diff.total_seconds() < 60:
+        return "たった今"
+    if diff.days > 0:
+        return f"{diff.days}日前"
+    elif diff.seconds > 3600:
+        hours = diff.seconds // 3600
+        return f"{hours}時間前"
+    elif diff.seconds > 60:
+        minutes = diff.seconds // 60
+        return f"{minutes}分前"
+    else:
+        return "たった今"
+
+
+# 履歴パネルの子ウィジェットのスタイルシート（$で始まる名前をテーマの色で置換する）
+STATS_LABEL_QSS = Template("""
+    QLabel#historyStatsLabel {
+        color: $text_secondary;
+        font-size: 11px;
+        padding: 4px;
+        background-color: $history_stats_bg;
+        border-radius: 4px;
+        border: 1px solid $history_stats_border;
+    }
+""")
+
+HEADER_BUTTON_QSS = Template("""
+    QPushButton#historyRefreshButton, QPushButton#historyMenuButton {
+        border: 1px solid $border;
+        border-radius: 15px;
+        background-color: $surface_variant;
+        color: $text_primary;
+    }
+    QPushButton#historyRefreshButton:hover, QPushButton#historyMenuButton:hover {
+        background-color: $surface;
+    }
+""")
+
+EMPTY_LABEL_QSS = Template("""
+    QLabel#historyEmptyLabel {
+        color: $text_disabled;
+        font-style: italic;
+        padding: 40px;
+    }
+""")
+
+# テーマ適用前の空メッセージの色
+DEFAULT_EMPTY_LABEL_COLOR = "#95a5a6"
+
+
+@lru_cache(maxsize=8)
+def _panel_style(theme_manager, theme: str) -> str:
+    """
+    履歴パネル全体のスタイルシートを生成
+    
+    theme_managerのスタイルは現在のテーマに依存するため、テーマ名をキーに含めてキャッシュする
+    """
+    colors = theme_manager.get_colors()
+    
+    return (
+        theme_manager.generate_list_style()
+        + theme_manager.generate_button_style("primary", selector="QPushButton#historyApplyButton")
+        + theme_manager.generate_button_style("danger", selector="QPushButton#historyDeleteButton")
+        + STATS_LABEL_QSS.substitute(colors)
+        + HEADER_BUTTON_QSS.substitute(colors)
+        + EMPTY_LABEL_QSS.substitute(colors)
+    )
+
+
+class HistoryListModel(QAbstractListModel):
+    """履歴一覧のモデル（行ごとのウィジェットは作らず、描画はHistoryItemDelegateが行う）"""
     
-    def __init__(self, history: ProcessingHistory, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.history = history
-        
-        # ラベルの参照を保持
-        self.name_label = None
-        self.use_count_label = None
-        self.input_label = None
-        self.provider_label = None
-        self.output_label = None
-        self.time_label = None
+        # 表示中の履歴一覧（モデルだけが保持し、外部とは共有しない）
+        self._histories: List[ProcessingHistory] = []
         
-        self._setup_ui()
+        # 履歴IDから行番号への対応
+        self._row_index: Dict[str, int] = {}
     
-    def _setup_ui(self):
-        """UIの設定"""
-        layout = QVBoxLayout()
-        layout.setSpacing(4)
-        layout.setContentsMargins(8, 8, 8, 8)
-        
-        # 名前とタイムスタンプ
-        header_layout = QHBoxLayout()
-        
-        self.name_label = QLabel(self.history.name)
-        name_font = QFont()
-        name_font.setBold(True)
-        name_font.setPointSize(11)
-        self.name_label.setFont(name_font)
-        # スタイルはテーマ適用時に設定
-        header_layout.addWidget(self.name_label)
-        
-        header_layout.addStretch()
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._histories)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        history = self._histories[index.row()]
+        if role == Qt.DisplayRole:
+            return history.name
+        if role == Qt.ToolTipRole:
+            return f"入力: {history.input_path}\n出力: {history.output_dir}"
+        return None
+    
+    def history_at(self, row: int) -> ProcessingHistory:
+        """行の履歴を取得"""
+        return self._histories[row]
+    
+    def row_of(self, history_id: str) -> Optional[int]:
+        """履歴IDの行番号を取得（存在しない場合はNone）"""
+        return self._row_index.get(history_id)
+    
+    def refresh_history(self, history_id: str):
+        """
+        使用回数が増えた履歴の行を更新する
         
-        # 使用回数
-        self.use_count_label = QLabel(f"使用回数: {self.history.use_count}")
-        # スタイルはテーマ適用時に設定
-        header_layout.addWidget(self.use_count_label)
+        一覧は使用回数・最終使用日時の多い順のため、必要な位置まで行を上に移動してから再描画を通知する
+        """
+        row = self._row_index.get(history_id)
+        if row is None:
+            return
         
-        layout.addLayout(header_layout)
+        history = self._histories[row]
+        sort_key = (history.use_count, history.last_used)
+        target = row
+        while target > 0 and (self._histories[target - 1].use_count,
+                              self._histories[target - 1].last_used) < sort_key:
+            target -= 1
+        
+        if target != row:
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), target)
+            self._histories.insert(target, self._histories.pop(row))
+            self.endMoveRows()
+            for moved_row in range(target, row + 1):
+                self._row_index[self._histories[moved_row].id] = moved_row
+        
+        index = self.index(target)
+        self.dataChanged.emit(index, index)
+    
+    def update_histories(self, histories: List[ProcessingHistory]):
+        """
+        履歴一覧を更新する
         
-        # 詳細情報
-        details_layout = QVBoxLayout()
-        details_layout.setSpacing(2)
+        全体をリセットせず、削除・追加・移動された行だけをビューに通知する。
+        残った行は内容の変更のみを通知するため、選択状態やスクロール位置が保たれる。
+        """
+        new_ids = {history.id for history in histories}
+        if len(new_ids) != len(histories):
+            # IDが重複している場合は行を対応付けられないため全体をリセットする
+            self.beginResetModel()
+            self._histories = list(histories)
+            self._row_index = {history.id: row for row, history in enumerate(histories)}
+            self.endResetModel()
+            return
         
-        # 入力パス
-        self.input_label = QLabel(f"📁 入力: {self._truncate_path(self.history.input_path)}")
-        # スタイルはテーマ適用時に設定
-        details_layout.addWidget(self.input_label)
+        # 削除された行（後ろから削除して行番号のずれを防ぐ）
+        for row in range(len(self._histories) - 1, -1, -1):
+            if self._histories[row].id not in new_ids:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._histories[row]
+                self.endRemoveRows()
+        
+        # 追加・移動された行（先頭から新しい並び順に揃える）
+        current_ids = [history.id for history in self._histories]
+        existing_ids = set(current_ids)
+        for row, history in enumerate(histories):
+            if row < len(current_ids) and current_ids[row] == history.id:
+                continue
+            if history.id in existing_ids:
+                source = current_ids.index(history.id, row)
+                self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+                self._histories.insert(row, self._histories.pop(source))
+                current_ids.insert(row, current_ids.pop(source))
+                self.endMoveRows()
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._histories.insert(row, history)
+                current_ids.insert(row, history.id)
+                self.endInsertRows()
+        
+        # 残った行は新しいオブジェクトに差し替え、再描画のみを通知する
+        # （渡された一覧は複製して保持し、呼び出し元での変更の影響を受けないようにする）
+        self._histories = list(histories)
+        self._row_index = {history.id: row for row, history in enumerate(histories)}
+        if histories:
+            self.dataChanged.emit(self.index(0), self.index(len(histories) - 1))
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """履歴項目の描画デリゲート（名前・パス・プロバイダー・日時をQPainterで直接描画）"""
+    
+    # 項目の内側余白と行間（ピクセル）
+    MARGIN = 8
+    HEADER_SPACING = 4
+    LINE_SPACING = 2
+    
+    # 詳細行の数（入力パス、プロバイダー、出力先、最終使用日時）
+    DETAIL_LINES = 4
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
         
-        # プロバイダーとモデル
-        self.provider_label = QLabel(f"🔧 {self.history.provider} / {self.history.model}")
-        # スタイルはテーマ適用時に設定
-        details_layout.addWidget(self.provider_label)
+        self._name_font = QFont()
+        self._name_font.setBold(True)
+        self._name_font.setPointSize(11)
+        self._detail_font = QFont()
+        self._detail_font.setPixelSize(10)
+        
+        self._name_metrics = QFontMetrics(self._name_font)
+        self._detail_metrics = QFontMetrics(self._detail_font)
+        
+        # 全項目で共通の高さ（フォントから一度だけ計算する）
+        self._row_height = (
+            self.MARGIN * 2
+            + self._name_metrics.height()
+            + self.HEADER_SPACING
+            + self._detail_metrics.height() * self.DETAIL_LINES
+            + self.LINE_SPACING * (self.DETAIL_LINES - 1)
+        )
         
-        # 出力先
-        self.output_label = QLabel(f"📤 出力: {self._truncate_path(self.history.output_dir)}")
-        # スタイルはテーマ適用時に設定
-        details_layout.addWidget(self.output_label)
+        # テーマの色（apply_themeで設定）
+        self._colors: Dict[str, QColor] = {}
+        self._last_theme_key: Optional[Tuple[int, str]] = None
         
-        # 最終使用日時
-        last_used = datetime.fromisoformat(self.history.last_used)
-        time_diff = self._get_time_diff(last_used)
-        self.time_label = QLabel(f"🕒 最終使用: {time_diff}")
-        # スタイルはテーマ適用時に設定
-        details_layout.addWidget(self.time_label)
+        # 最終使用日時の表示に使用する現在時刻（分単位。全項目で共有し、update_nowで進める）
+        self._minute_bucket = 0
+        self.update_now()
+    
+    def update_now(self):
+        """時間差の表示に使用する現在時刻を更新"""
+        self._minute_bucket = int(time.time() // 60)
+    
+    def apply_theme(self, theme_manager):
+        """テーマを適用（前回と同じテーマの場合は何もしない）"""
+        theme_key = (id(theme_manager), theme_manager.get_current_theme())
+        if theme_key == self._last_theme_key:
+            return
+        self._last_theme_key = theme_key
         
-        layout.addLayout(details_layout)
+        self._colors = {
+            key: theme_manager.get_qcolor(key)
+            for key in ("text_primary", "text_secondary", "text_disabled",
+                        "button_primary", "button_success")
+        }
+    
+    def _pen_color(self, key: str, option: QStyleOptionViewItem):
+        """テーマの色を取得（テーマ適用前はパレットの文字色）"""
+        color = self._colors.get(key)
+        return color if color is not None else option.palette.color(QPalette.Text)
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self._row_height)
+    
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        history = index.model().history_at(index.row())
+        
+        # 背景（選択・ホバー）はスタイルに任せ、文字は自前で描画する
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        
+        rect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        
+        painter.save()
+        
+        # 名前と使用回数
+        name_height = self._name_metrics.height()
+        header_rect = QRect(rect.left(), rect.top(), rect.width(), name_height)
+        use_count_text = f"使用回数: {history.use_count}"
+        painter.setFont(self._detail_font)
+        painter.setPen(self._pen_color("text_secondary", option))
+        painter.drawText(header_rect, Qt.AlignRight | Qt.AlignVCenter, use_count_text)
+        
+        name_width = header_rect.width() - self._detail_metrics.horizontalAdvance(use_count_text) - self.MARGIN
+        painter.setFont(self._name_font)
+        painter.setPen(self._pen_color("text_primary", option))
+        painter.drawText(header_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         self._name_metrics.elidedText(history.name, Qt.ElideRight, max(name_width, 0)))
         
-        self.setLayout(layout)
+        # 詳細情報
+        input_text, provider_text, output_text = _detail_texts(
+            history.input_path, history.provider, history.model, history.output_dir
+        )
+        # パスは項目の幅に合わせて中央を省略し、見出しとファイル名を残す
+        details = (
+            (input_text, "text_secondary", Qt.ElideMiddle),
+            (provider_text, "button_primary", Qt.ElideRight),
+            (output_text, "button_success", Qt.ElideMiddle),
+            (f"🕒 最終使用: {_bucket_time_diff(history.last_used, self._minute_bucket)}", "text_disabled", Qt.ElideRight),
+        )
         
-        # ホバー効果（スタイルはテーマ適用時に設定）
-    
-    def _truncate_path(self, path: str, max_length: int = 50) -> str:
-        """パスを短縮表示"""
-        if len(path) <= max_length:
-            return path
-        return "..." + path[-(max_length-3):]
-    
-    def _get_time_diff(self, dt: datetime) -> str:
-        """時間差を人間にわかりやすい形式で表示"""
-        now = datetime.now()
-        diff = now - dt
-        
-        if diff.days > 0:
-            return f"{diff.days}日前"
-        elif diff.seconds > 3600:
-            hours = diff.seconds // 3600
-            return f"{hours}時間前"
-        elif diff.seconds > 60:
-            minutes = diff.seconds // 60
-            return f"{minutes}分前"
-        else:
-            return "たった今"
-    
-    def apply_theme(self, theme_manager):
-        """テーマを適用"""
-        colors = theme_manager.get_colors()
-        
-        # 名前ラベルのスタイル
-        self.name_label.setStyleSheet(f"color: {colors['text_primary']};")
-        
-        # 使用回数ラベルのスタイル
-        self.use_count_label.setStyleSheet(f"color: {colors['text_secondary']}; font-size: 10px;")
-        
-        # 詳細情報ラベルのスタイル
-        self.input_label.setStyleSheet(f"color: {colors['text_secondary']}; font-size: 10px;")
-        self.provider_label.setStyleSheet(f"color: {colors['button_primary']}; font-size: 10px;")
-        self.output_label.setStyleSheet(f"color: {colors['button_success']}; font-size: 10px;")
-        self.time_label.setStyleSheet(f"color: {colors['text_disabled']}; font-size: 10px;")
-        
-        # ホバー効果
-        hover_style = f"""
-            QWidget:hover {{
-                background-color: {colors['history_item_hover']};
-                border-radius: 4px;
-            }}
-        """
-        self.setStyleSheet(hover_style)
+        painter.setFont(self._detail_font)
+        line_height = self._detail_metrics.height()
+        y = header_rect.bottom() + 1 + self.HEADER_SPACING
+        for text, color_key, elide_mode in details:
+            painter.setPen(self._pen_color(color_key, option))
+            painter.drawText(QRect(rect.left(), y, rect.width(), line_height),
+                             Qt.AlignLeft | Qt.AlignVCenter,
+                             self._detail_metrics.elidedText(text, elide_mode, rect.width()))
+            y += line_height + self.LINE_SPACING
+        
+        painter.restore()
 
 
 class HistoryWidget(QWidget):
@@ -147,20 +355,43 @@ class HistoryWidget(QWidget):
     history_selected = pyqtSignal(object)  # ProcessingHistory
     history_applied = pyqtSignal(object)   # ProcessingHistory
     
+    # 最終使用日時の表示を更新する間隔（ミリ秒）
+    TIME_REFRESH_INTERVAL_MS = 60000
+    
+    # 変更をまとめて表示を更新するまでの待機時間（ミリ秒）
+    RELOAD_DELAY_MS = 50
+    
+    # 履歴リストの項目を一度に配置する件数
+    LAYOUT_BATCH_SIZE = 50
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.history_manager = HistoryManager()
-        self.current_histories: List[ProcessingHistory] = []
+        self._stats: Dict[str, Any] = {}
         self.is_translating = False  # 翻訳処理中フラグ
         
+        # 非表示中に更新が要求されたかどうか（表示時にまとめて更新する）
+        self._pending_refresh = False
+        
+        # 最後に適用したテーマ（apply_themeで同じテーマを適用し直さないため）
+        self._last_theme_key: Optional[Tuple[int, str]] = None
+        
         self._setup_ui()
         self._load_histories()
         
-        # 定期的に履歴を更新（5分間隔に変更）
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self._refresh_histories)
-        self.refresh_timer.start(300000)  # 5分間隔（300000ms）
+        # 短時間に続いた変更をまとめて1回の表示更新にするタイマー
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.timeout.connect(self._load_histories)
+        
+        # 履歴が変更された時のみ表示を更新する
+        self.history_manager.history_changed.connect(self._on_history_changed)
+        
+        # 「X分前」の表示を更新するタイマー（再描画のみで、ファイルは読み込まない）
+        self.time_refresh_timer = QTimer()
+        self.time_refresh_timer.timeout.connect(self._refresh_time_labels)
+        self.time_refresh_timer.start(self.TIME_REFRESH_INTERVAL_MS)
     
     def _setup_ui(self):
         """UIの設定"""
@@ -184,6 +415,7 @@ class HistoryWidget(QWidget):
         self.refresh_button.setToolTip("履歴を更新")
         self.refresh_button.clicked.connect(self._refresh_histories)
         self.refresh_button.setFixedSize(30, 30)
+        self.refresh_button.setObjectName("historyRefreshButton")
         # スタイルはテーマ適用時に設定
         header_layout.addWidget(self.refresh_button)
         
@@ -191,6 +423,7 @@ class HistoryWidget(QWidget):
         self.menu_button.setToolTip("履歴管理メニュー")
         self.menu_button.clicked.connect(self._show_menu)
         self.menu_button.setFixedSize(30, 30)
+        self.menu_button.setObjectName("historyMenuButton")
         # スタイルはテーマ適用時に設定
         header_layout.addWidget(self.menu_button)
         
@@ -198,14 +431,24 @@ class HistoryWidget(QWidget):
         
         # 統計情報
         self.stats_label = QLabel("")
+        self.stats_label.setObjectName("historyStatsLabel")
         # スタイルはテーマ適用時に設定
         layout.addWidget(self.stats_label)
         
         # 履歴リスト
-        self.history_list = QListWidget()
+        self.history_model = HistoryListModel(self)
+        self.history_delegate = HistoryItemDelegate(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setItemDelegate(self.history_delegate)
+        # 全項目が同じ高さのため、サイズ計算を1回で済ませる
+        self.history_list.setUniformItemSizes(True)
+        # 項目の配置を分割して行い、履歴が多い場合も最初の表示を待たせない
+        self.history_list.setLayoutMode(QListView.Batched)
+        self.history_list.setBatchSize(self.LAYOUT_BATCH_SIZE)
         # スタイルはテーマ適用時に設定
-        self.history_list.itemClicked.connect(self._on_history_selected)
-        self.history_list.itemDoubleClicked.connect(self._on_history_double_clicked)
+        self.history_list.selectionModel().currentChanged.connect(self._on_history_selected)
+        self.history_list.doubleClicked.connect(self._on_history_double_clicked)
         self.history_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.history_list.customContextMenuRequested.connect(self._show_context_menu)
         layout.addWidget(self.history_list)
@@ -216,12 +459,14 @@ class HistoryWidget(QWidget):
         self.apply_button = QPushButton("📋 設定を適用")
         self.apply_button.clicked.connect(self._apply_selected_history)
         self.apply_button.setEnabled(False)
+        self.apply_button.setObjectName("historyApplyButton")
         # スタイルはテーマ適用時に設定
         button_layout.addWidget(self.apply_button)
         
         self.delete_button = QPushButton("🗑️ 削除")
         self.delete_button.clicked.connect(self._delete_selected_history)
         self.delete_button.setEnabled(False)
+        self.delete_button.setObjectName("historyDeleteButton")
         # スタイルはテーマ適用時に設定
         button_layout.addWidget(self.delete_button)
         
@@ -231,58 +476,70 @@ class HistoryWidget(QWidget):
         # 空の状態メッセージ
         self.empty_label = QLabel("履歴がありません\n処理を実行すると履歴が保存されます")
         self.empty_label.setAlignment(Qt.AlignCenter)
-        self.empty_label.setStyleSheet("""
-            QLabel {
-                color: #95a5a6;
-                font-style: italic;
-                padding: 40px;
-            }
-        """)
+        self.empty_label.setObjectName("historyEmptyLabel")
         self.empty_label.hide()
         layout.addWidget(self.empty_label)
         
         self.setLayout(layout)
+        
+        # テーマ適用前のスタイル（apply_themeでまとめて置き換える）
+        self.setStyleSheet(EMPTY_LABEL_QSS.substitute(text_disabled=DEFAULT_EMPTY_LABEL_COLOR))
     
     def _load_histories(self):
         """履歴を読み込み"""
-        self.current_histories = self.history_manager.get_history_list()
-        self._update_history_display()
+        self._update_history_display(self.history_manager.get_history_list())
         self._update_stats()
     
-    def _update_history_display(self):
+    def _update_history_display(self, histories: List[ProcessingHistory]):
         """履歴表示を更新"""
-        self.history_list.clear()
-        
-        if not self.current_histories:
+        self.history_delegate.update_now()
+        
+        # 行ごとの再描画と、選択行の削除に伴う選択変更の通知を抑止し、最後に1回だけ描画する
+        self.history_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.history_list.selectionModel()):
+                self.history_model.update_histories(histories)
+        finally:
+            self.history_list.setUpdatesEnabled(True)
+        
+        # 選択中の履歴が削除された場合は操作ボタンを無効にする
+        if not self.history_list.currentIndex().isValid():
+            self.apply_button.setEnabled(False)
+            self.delete_button.setEnabled(False)
+        
+        if not histories:
             self.empty_label.show()
             self.history_list.hide()
             return
         
         self.empty_label.hide()
         self.history_list.show()
-        
-        for history in self.current_histories:
-            # カスタムウィジェットを作成
-            item_widget = HistoryItemWidget(history)
-            
-            # テーマを適用（テーママネージャーが利用可能な場合）
-            if hasattr(self, 'theme_manager'):
-                item_widget.apply_theme(self.theme_manager)
-            
-            # リストアイテムを作成
-            list_item = QListWidgetItem()
-            list_item.setData(Qt.UserRole, history)
-            
-            # ウィジェットをリストアイテムに設定
-            self.history_list.addItem(list_item)
-            self.history_list.setItemWidget(list_item, item_widget)
-            
-            # アイテムのサイズを調整
-            list_item.setSizeHint(item_widget.sizeHint())
     
     def _update_stats(self):
         """統計情報を更新"""
-        stats = self.history_manager.get_history_stats()
+        self._stats = self.history_manager.get_history_stats()
+        self._show_stats()
+    
+    def _add_usage_to_stats(self, history: ProcessingHistory):
+        """履歴が1回使用された分だけ統計情報を更新（全履歴を集計し直さない）"""
+        stats = self._stats
+        provider_usage = stats.get('provider_usage')
+        model_usage = stats.get('model_usage')
+        if not provider_usage or model_usage is None:
+            self._update_stats()
+            return
+        
+        stats['total_usage'] += 1
+        provider_usage[history.provider] = provider_usage.get(history.provider, 0) + 1
+        model_usage[history.model] = model_usage.get(history.model, 0) + 1
+        # 最多の項目はHistoryManagerの集計（Counter.most_common）と同じく、同数なら先に集計されたものを選ぶ
+        stats['most_used_provider'] = max(provider_usage, key=provider_usage.get)
+        stats['most_used_model'] = max(model_usage, key=model_usage.get)
+        self._show_stats()
+    
+    def _show_stats(self):
+        """統計情報を表示"""
+        stats = self._stats
         
         if stats['total_count'] == 0:
             self.stats_label.setText("履歴なし")
@@ -295,64 +552,91 @@ class HistoryWidget(QWidget):
             self.stats_label.setText(text)
     
     def _refresh_histories(self):
-        """履歴を更新"""
-        self.history_manager.load_history()
-        self._load_histories()
+        """履歴を更新（非表示中は表示されるまで延期する）"""
+        if not self.isVisible():
+            self._pending_refresh = True
+            return
+        
+        self._pending_refresh = False
+        # ファイルの読み込みはワーカースレッドで行い、完了時のhistory_changedで表示を更新する
+        self.history_manager.load_history_async()
+    
+    def _on_history_changed(self):
+        """履歴が変更された時（非表示中は表示されるまで延期する）"""
+        if self.isVisible():
+            self._schedule_refresh()
+        else:
+            self._pending_refresh = True
+    
+    def _schedule_refresh(self):
+        """表示の更新を予約する（待機中の変更はまとめて1回で更新する）"""
+        self._reload_timer.start(self.RELOAD_DELAY_MS)
     
-    def _on_history_selected(self, item: QListWidgetItem):
+    def _refresh_time_labels(self):
+        """最終使用日時の表示を更新"""
+        if self.isVisible():
+            self.history_delegate.update_now()
+            self.history_list.viewport().update()
+    
+    def showEvent(self, event):
+        """表示された時に延期していた更新を行う"""
+        super().showEvent(event)
+        if self._pending_refresh:
+            self._refresh_histories()
+    
+    def _history_at(self, index: QModelIndex) -> Optional[ProcessingHistory]:
+        """リストのインデックスに対応する履歴を取得（無効なインデックスの場合はNone）"""
+        return self.history_model.history_at(index.row()) if index.isValid() else None
+    
+    def _on_history_selected(self, current: QModelIndex, previous: QModelIndex):
         """履歴が選択された時"""
-        history = item.data(Qt.UserRole)
+        history = self._history_at(current)
         if history:
             self.apply_button.setEnabled(True)
             self.delete_button.setEnabled(True)
             self.history_selected.emit(history)
     
-    def _on_history_double_clicked(self, item: QListWidgetItem):
+    def _on_history_double_clicked(self, index: QModelIndex):
         """履歴がダブルクリックされた時"""
         self._apply_selected_history()
     
     def _apply_selected_history(self):
         """選択された履歴を適用"""
-        current_item = self.history_list.currentItem()
-        if current_item:
-            history = current_item.data(Qt.UserRole)
-            if history:
-                # 使用回数を更新
-                self.history_manager.update_history_usage(history.id)
-                self._load_histories()  # 表示を更新
-                
-                # シグナルを発信
-                self.history_applied.emit(history)
+        history = self._history_at(self.history_list.currentIndex())
+        if history:
+            # 使用回数を更新し、該当する行と統計情報のみを表示に反映する
+            if self.history_manager.update_history_usage(history.id):
+                self.history_delegate.update_now()
+                self.history_model.refresh_history(history.id)
+                self._add_usage_to_stats(history)
+            
+            # シグナルを発信
+            self.history_applied.emit(history)
     
     def _delete_selected_history(self):
         """選択された履歴を削除"""
-        current_item = self.history_list.currentItem()
-        if current_item:
-            history = current_item.data(Qt.UserRole)
-            if history:
-                reply = QMessageBox.question(
-                    self,
-                    "履歴削除",
-                    f"履歴「{history.name}」を削除しますか？",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No
-                )
-                
-                if reply == QMessageBox.Yes:
-                    if self.history_manager.delete_history(history.id):
-                        self._load_histories()
-                        self.apply_button.setEnabled(False)
-                        self.delete_button.setEnabled(False)
-                        QMessageBox.information(self, "削除完了", "履歴を削除しました。")
-                    else:
-                        QMessageBox.warning(self, "削除エラー", "履歴の削除に失敗しました。")
+        history = self._history_at(self.history_list.currentIndex())
+        if history:
+            reply = QMessageBox.question(
+                self,
+                "履歴削除",
+                f"履歴「{history.name}」を削除しますか？",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            
+            if reply == QMessageBox.Yes:
+                if self.history_manager.delete_history(history.id):
+                    self.apply_button.setEnabled(False)
+                    self.delete_button.setEnabled(False)
+                    QMessageBox.information(self, "削除完了", "履歴を削除しました。")
+                else:
+                    QMessageBox.warning(self, "削除エラー", "履歴の削除に失敗しました。")
     
     def _show_context_menu(self, position):
         """コンテキストメニューを表示"""
-        item = self.history_list.itemAt(position)
-        if item:
-            history = item.data(Qt.UserRole)
-            
+        history = self._history_at(self.history_list.indexAt(position))
+        if history:
             menu = QMenu(self)
             
             apply_action = menu.addAction("📋 設定を適用")
@@ -397,7 +681,7 @@ class HistoryWidget(QWidget):
         if ok and new_name.strip():
             history.name = new_name.strip()
             self.history_manager.save_history()
-            self._load_histories()
+            self._schedule_refresh()
     
     def _clear_all_history(self):
         """全履歴を削除"""
@@ -411,7 +695,6 @@ class HistoryWidget(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.history_manager.clear_all_history():
-                self._load_histories()
                 self.apply_button.setEnabled(False)
                 self.delete_button.setEnabled(False)
                 QMessageBox.information(self, "削除完了", "全ての履歴を削除しました。")
@@ -454,7 +737,6 @@ class HistoryWidget(QWidget):
             if reply != QMessageBox.Cancel:
                 merge = reply == QMessageBox.Yes
                 if self.history_manager.import_history(filename, merge):
-                    self._load_histories()
                     QMessageBox.information(self, "インポート完了", "履歴をインポートしました。")
                 else:
                     QMessageBox.warning(self, "インポートエラー", "履歴のインポートに失敗しました。")
@@ -465,87 +747,49 @@ class HistoryWidget(QWidget):
         history_id = self.history_manager.add_history(
             name, input_path, provider, model, output_dir, image_dir, force_overwrite
         )
-        self._load_histories()
         return history_id
     
     def get_selected_history(self) -> Optional[ProcessingHistory]:
         """選択された履歴を取得"""
-        current_item = self.history_list.currentItem()
-        if current_item:
-            return current_item.data(Qt.UserRole)
-        return None
+        return self._history_at(self.history_list.currentIndex())
+    
     def set_translation_state(self, is_translating: bool):
         """翻訳状態を設定し、タイマーを制御"""
         self.is_translating = is_translating
         
         if is_translating:
             # 翻訳開始時はタイマーを停止
-            if self.refresh_timer.isActive():
-                self.refresh_timer.stop()
+            if self.time_refresh_timer.isActive():
+                self.time_refresh_timer.stop()
         else:
-            # 翻訳終了時はタイマーを再開（5分間隔）
-            if not self.refresh_timer.isActive():
-                self.refresh_timer.start(300000)  # 5分間隔
+            # 翻訳終了時はタイマーを再開
+            if not self.time_refresh_timer.isActive():
+                self.time_refresh_timer.start(self.TIME_REFRESH_INTERVAL_MS)
     
     def pause_auto_refresh(self):
         """自動更新を一時停止"""
-        if self.refresh_timer.isActive():
-            self.refresh_timer.stop()
+        if self.time_refresh_timer.isActive():
+            self.time_refresh_timer.stop()
     
     def resume_auto_refresh(self):
         """自動更新を再開"""
-        if not self.refresh_timer.isActive() and not self.is_translating:
-            self.refresh_timer.start(300000)  # 5分間隔
+        if not self.time_refresh_timer.isActive() and not self.is_translating:
+            self.time_refresh_timer.start(self.TIME_REFRESH_INTERVAL_MS)
     
     def apply_theme(self, theme_manager):
-        """テーマを適用"""
+        """テーマを適用（前回と同じテーマの場合は何もしない）"""
         self.theme_manager = theme_manager
-        colors = theme_manager.get_colors()
-        
-        # 履歴リストのスタイル
-        self.history_list.setStyleSheet(theme_manager.generate_list_style())
-        
-        # 統計情報ラベルのスタイル
-        stats_style = f"""
-            QLabel {{
-                color: {colors['text_secondary']};
-                font-size: 11px;
-                padding: 4px;
-                background-color: {colors['history_stats_bg']};
-                border-radius: 4px;
-                border: 1px solid {colors['history_stats_border']};
-            }}
-        """
-        self.stats_label.setStyleSheet(stats_style)
-        
-        # ボタンのスタイル
-        self.apply_button.setStyleSheet(theme_manager.generate_button_style("primary"))
-        self.delete_button.setStyleSheet(theme_manager.generate_button_style("danger"))
-        
-        # 小さなボタンのスタイル
-        small_button_style = theme_manager.generate_button_style("secondary")
-        small_button_style = small_button_style.replace("padding: 8px 16px;", "padding: 4px 8px;")
-        
-        refresh_style = f"""
-            QPushButton {{
-                border: 1px solid {colors['border']};
-                border-radius: 15px;
-                background-color: {colors['surface_variant']};
-                color: {colors['text_primary']};
-            }}
-            QPushButton:hover {{
-                background-color: {colors['surface']};
-            }}
-        """
-        self.refresh_button.setStyleSheet(refresh_style)
-        self.menu_button.setStyleSheet(refresh_style)
-        
-        # 空メッセージのスタイル
-        empty_style = f"""
-            QLabel {{
-                color: {colors['text_disabled']};
-                font-style: italic;
-                padding: 40px;
-            }}
-        """
-        self.empty_label.setStyleSheet(empty_style)
\ No newline at end of file
+        
+        # 同じスタイルシートを設定し直してもQtは再ポリッシュするため、テーマが変わった時のみ設定する
+        theme = theme_manager.get_current_theme()
+        theme_key = (id(theme_manager), theme)
+        if theme_key == self._last_theme_key:
+            return
+        self._last_theme_key = theme_key
+        
+        # 子ウィジェットのスタイル（再ポリッシュを1回にするため、このウィジェットにまとめて設定する）
+        self.setStyleSheet(_panel_style(theme_manager, theme))
+        
+        # 履歴項目の描画色
+        self.history_delegate.apply_theme(theme_manager)
+        self.history_list.viewport().update()
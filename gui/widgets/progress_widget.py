@@ -4,10 +4,19 @@
 """
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QProgressBar, QTextEdit, QPushButton, QFrame,
+                             QProgressBar, QPlainTextEdit, QPushButton, QFrame,
                              QSplitter, QScrollArea)
 from PyQt5.QtCore import Qt, QTimer, pyqtSlot
-from PyQt5.QtGui import QFont, QTextCursor
+from PyQt5.QtGui import QFont
+from collections import deque
+from functools import lru_cache
+from datetime import datetime
+import html
+import re
+
+
+# ログ表示に保持する最大行数（古い行から破棄する）
+MAXIMUM_BLOCK_COUNT = 5000
 
 
 class LogLevel:
@@ -18,11 +27,73 @@ class LogLevel:
     ERROR = "ERROR"
 
 
+# ログレベルごとの（表示色, 表示記号）
+LOG_LEVEL_STYLES = {
+    LogLevel.ERROR: ("#dc3545", "❌"),
+    LogLevel.WARNING: ("#ffc107", "⚠️"),
+    LogLevel.INFO: ("#28a745", "ℹ️"),
+    LogLevel.DEBUG: ("#6c757d", "🔍"),
+}
+
+# ログレベルの重要度（min_level未満のログは表示しない）
+LOG_LEVEL_RANKS = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+}
+
+# 改行コード（\r\n, \r, \n すべて）
+_NEWLINE_RE = re.compile(r'\r\n|\r|\n')
+
+# テーマ適用前の時刻の表示色（テーマ適用後はテーマのtext_secondaryを使用する）
+DEFAULT_LOG_TIMESTAMP_COLOR = "#6c757d"
+
+# ログのレベル表示のスタイルシート（HTMLのクラスと色の対応）
+_LOG_LEVEL_CSS = "\n".join(
+    f".lvl-{level.lower()} {{ color: {color}; font-weight: bold; }}"
+    for level, (color, _prefix) in LOG_LEVEL_STYLES.items()
+)
+
+
+@lru_cache(maxsize=4)
+def _log_document_css(timestamp_color: str) -> str:
+    """
+    ログの文書に設定するスタイルシートを生成（テーマの色ごとにキャッシュされる）
+    
+    本文には色を指定せず、テーマのスタイルシートで設定されるウィジェットの文字色を使用する。
+    文書のスタイルシートは以降に追加するログにのみ適用されるため、既存のログの時刻は元の色のまま残る
+    """
+    return f".ts {{ color: {timestamp_color}; }}\n{_LOG_LEVEL_CSS}"
+
+# ログ1件のHTML（時刻, レベルのクラス, 記号, レベル, 本文）
+_LOG_HTML_TEMPLATE = '<span class="ts">[%s]</span> <span class="lvl-%s">%s %s:</span> %s'
+
+
+def _format_log_html(timestamp: str, level: str, message: str) -> str:
+    """ログ1件をHTMLに整形（1件のログが1ブロックになる）"""
+    # メッセージの前処理：HTMLエスケープと改行変換（全改行コード対応）
+    formatted_content = _NEWLINE_RE.sub('<br>', html.escape(message))
+    
+    # レベルに応じてスタイルを設定（不明なレベルはDEBUGとして表示）
+    style_level = level if level in LOG_LEVEL_STYLES else LogLevel.DEBUG
+    prefix = LOG_LEVEL_STYLES[style_level][1]
+    
+    return _LOG_HTML_TEMPLATE % (timestamp, style_level.lower(), prefix, level, formatted_content)
+
+
 class ProgressWidget(QWidget):
     """
     処理進捗とログを表示するウィジェット
     """
     
+    # ログをまとめて表示に書き込む間隔（ミリ秒）
+    LOG_FLUSH_INTERVAL_MS = 50
+    
+    # セクション枠のスタイルの適用先（子のQLabelやログ表示もQFrameのため、オブジェクト名で限定する）
+    PROGRESS_FRAME_SELECTOR = "QFrame#progressSection"
+    LOG_FRAME_SELECTOR = "QFrame#logSection"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -31,12 +102,24 @@ class ProgressWidget(QWidget):
         self.total_files = 0
         self.processed_files = 0
         
+        # 表示するログの最低レベル（set_min_levelで変更する）
+        self.min_level = LogLevel.DEBUG
+        self._min_level_rank = LOG_LEVEL_RANKS[self.min_level]
+        
+        # 表示中のログの元データ（タイムスタンプ, レベル, メッセージ）。表示と同じ件数だけ保持する
+        self._log_entries = deque(maxlen=MAXIMUM_BLOCK_COUNT)
+        
+        # まだ表示に書き込んでいないログ（_flush_pending_logsでまとめて書き込む）
+        self._pending_logs = deque(maxlen=MAXIMUM_BLOCK_COUNT)
+        # 表示待ちの上限を超えて書き込まずに破棄したログの件数（書き込み時に省略を表示する）
+        self._dropped_logs = 0
+        
         self._setup_ui()
         
-        # ログ自動スクロール用タイマー
-        self.scroll_timer = QTimer()
-        self.scroll_timer.timeout.connect(self._auto_scroll_log)
-        self.scroll_timer.start(100)  # 100ms間隔
+        # 表示待ちのログをまとめて書き込むタイマー（ログの追加時のみ起動する）
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_pending_logs)
     
     def _setup_ui(self):
         """UIの設定"""
@@ -45,9 +128,10 @@ class ProgressWidget(QWidget):
         
         # 進捗情報セクション
         progress_frame = QFrame()
+        progress_frame.setObjectName("progressSection")
         progress_frame.setFrameStyle(QFrame.StyledPanel)
         progress_frame.setStyleSheet("""
-            QFrame {
+            QFrame#progressSection {
                 background-color: #f8f9fa;
                 border: 1px solid #dee2e6;
                 border-radius: 8px;
@@ -115,9 +199,10 @@ class ProgressWidget(QWidget):
         
         # ログセクション
         log_frame = QFrame()
+        log_frame.setObjectName("logSection")
         log_frame.setFrameStyle(QFrame.StyledPanel)
         log_frame.setStyleSheet("""
-            QFrame {
+            QFrame#logSection {
                 background-color: #f8f9fa;
                 border: 1px solid #dee2e6;
                 border-radius: 8px;
@@ -157,15 +242,25 @@ class ProgressWidget(QWidget):
         
         log_layout.addLayout(log_title_layout)
         
-        # ログテキスト表示
-        self.log_text = QTextEdit()
+        # ログテキスト表示（追記のみのため、リッチテキストのレイアウトを持たないQPlainTextEditを使用）
+        self.log_text = QPlainTextEdit()
         self.log_text.setMinimumHeight(200)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(MAXIMUM_BLOCK_COUNT)
+        self.log_text.document().setDefaultStyleSheet(_log_document_css(DEFAULT_LOG_TIMESTAMP_COLOR))
+        # 自動スクロールで毎回取得しないよう、スクロールバーの参照を保持する
+        self._log_scrollbar = self.log_text.verticalScrollBar()
         # スタイルはテーマ適用時に設定
         log_layout.addWidget(self.log_text)
         
         layout.addWidget(log_frame)
         
+        # テーマ適用時にスタイルを設定するフレームと、そのスタイルの適用先
+        self._themed_frames = (
+            (progress_frame, self.PROGRESS_FRAME_SELECTOR),
+            (log_frame, self.LOG_FRAME_SELECTOR),
+        )
+        
         self.setLayout(layout)
     
     def reset_progress(self):
@@ -229,10 +324,6 @@ class ProgressWidget(QWidget):
         self.overall_progress.setValue(max(0, min(100, progress)))
         self.overall_label.setText(f"{progress}%")
         self.status_label.setText(message)
-        
-        # UIの即座更新を強制実行
-        from PyQt5.QtWidgets import QApplication
-        QApplication.processEvents()
     
     @pyqtSlot(int, int, str)
     def update_page_progress(self, current_page: int, total_pages: int, filename: str):
@@ -242,10 +333,6 @@ class ProgressWidget(QWidget):
             self.file_progress.setValue(progress)
             self.file_label.setText(f"ページ {current_page}/{total_pages}")
             self.status_label.setText(f"翻訳中: {filename} - ページ {current_page}/{total_pages}")
-            
-            # UIの即座更新を強制実行
-            from PyQt5.QtWidgets import QApplication
-            QApplication.processEvents()
     
     @pyqtSlot(str)
     def start_file_processing(self, filename: str):
@@ -254,10 +341,6 @@ class ProgressWidget(QWidget):
         self.file_progress.setValue(0)
         self.file_label.setText(f"処理中: {filename}")
         self.add_log(LogLevel.INFO, f"📄 処理開始: {filename}")
-        
-        # UIの即座更新を強制実行
-        from PyQt5.QtWidgets import QApplication
-        QApplication.processEvents()
     
     @pyqtSlot(str, bool)
     def finish_file_processing(self, filename: str, success: bool):
@@ -271,10 +354,6 @@ class ProgressWidget(QWidget):
         else:
             self.file_label.setText(f"失敗: {filename}")
             self.add_log(LogLevel.ERROR, f"❌ 失敗: {filename}")
-        
-        # UIの即座更新を強制実行
-        from PyQt5.QtWidgets import QApplication
-        QApplication.processEvents()
     
     @pyqtSlot(str)
     def show_error(self, error_message: str):
@@ -294,79 +373,81 @@ class ProgressWidget(QWidget):
     
     @pyqtSlot(str, str)
     def add_log(self, level: str, message: str):
-        """ログメッセージを追加"""
-        from datetime import datetime
-        import html
+        """ログメッセージを追加（最低レベル未満のログは整形せずに破棄する）"""
+        if LOG_LEVEL_RANKS.get(level, 0) < self._min_level_rank:
+            return
         
         # タイムスタンプを追加
         timestamp = datetime.now().strftime("%H:%M:%S")
+        entry = (timestamp, level, message)
+        self._log_entries.append(entry)
+        
+        # 表示への書き込みは一定間隔でまとめて行う
+        if len(self._pending_logs) == self._pending_logs.maxlen:
+            self._dropped_logs += 1
+        self._pending_logs.append(entry)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(self.LOG_FLUSH_INTERVAL_MS)
+    
+    def _flush_pending_logs(self):
+        """表示待ちのログをまとめて書き込む（非表示中は表示されるまで保留する）"""
+        if not self._pending_logs or not self.log_text.isVisible():
+            return
         
-        # メッセージの前処理：HTMLエスケープと改行変換（全改行コード対応）
-        escaped_message = html.escape(message)
-        # \r\n, \r, \n すべてを <br> に変換
-        import re
-        formatted_content = re.sub(r'(\r\n|\r|\n)', '<br>', escaped_message)
-        
-        # テーマカラーを取得（テーマが設定されている場合）
-        if hasattr(self, 'theme_manager') and self.theme_manager:
-            colors = self.theme_manager.get_colors()
-            timestamp_color = colors['text_secondary']
-            text_color = colors['text_primary']
-        else:
-            # フォールバック色
-            timestamp_color = "#6c757d"
-            text_color = "#333333"
-        
-        # レベルに応じてスタイルを設定
-        if level == LogLevel.ERROR:
-            color = "#dc3545"
-            prefix = "❌"
-        elif level == LogLevel.WARNING:
-            color = "#ffc107"
-            prefix = "⚠️"
-        elif level == LogLevel.INFO:
-            color = "#28a745"
-            prefix = "ℹ️"
-        else:  # DEBUG
-            color = "#6c757d"
-            prefix = "🔍"
-        
-        # HTMLでフォーマット（テーマ対応）- 最後に改行を追加
-        import textwrap
-        formatted_message = textwrap.dedent(f"""\
-            <div style="margin: 2px 0; color: {text_color};">
-                <span style="color: {timestamp_color};">[{timestamp}]</span>
-                <span style="color: {color}; font-weight: bold;">{prefix} {level}:</span>
-                <span>{formatted_content}</span>
-            </div><br>
-        """)
-        
-        # ログに追加
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertHtml(formatted_message)
-        
-        # 自動スクロール（少し遅延させる）
-        QTimer.singleShot(50, self._scroll_to_bottom)
+        # 1件ずつ別のブロックとして追加し（最大行数の制御のため）、再描画は最後に1回だけ行う
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            if self._dropped_logs:
+                # 破棄したログがあることを黙って隠さず、件数を表示する
+                timestamp = self._pending_logs[0][0]
+                self.log_text.appendHtml(_format_log_html(
+                    timestamp, LogLevel.WARNING, f"…{self._dropped_logs}行のログを省略しました"
+                ))
+                self._dropped_logs = 0
+            while self._pending_logs:
+                self.log_text.appendHtml(_format_log_html(*self._pending_logs.popleft()))
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+        
+        # 書き込んだ分だけ自動スクロール（書き込みは表示中のみのため、スクロールも表示中のみ）
+        self._scroll_to_bottom()
+    
+    def showEvent(self, event):
+        """表示された時に保留していたログを書き込む"""
+        super().showEvent(event)
+        self._flush_pending_logs()
+    
+    def set_min_level(self, level: str):
+        """表示するログの最低レベルを設定"""
+        if level not in LOG_LEVEL_RANKS:
+            raise ValueError(f"不明なログレベル: {level}")
+        self.min_level = level
+        self._min_level_rank = LOG_LEVEL_RANKS[level]
     
-    def _auto_scroll_log(self):
-        """ログの自動スクロール"""
-        if self.is_processing:
-            self._scroll_to_bottom()
+    @pyqtSlot(list)
+    def add_logs(self, entries: list):
+        """複数のログメッセージをまとめて追加"""
+        for level, message in entries:
+            self.add_log(level, message)
     
     def _scroll_to_bottom(self):
         """ログを最下部にスクロール"""
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._log_scrollbar.setValue(self._log_scrollbar.maximum())
     
     def clear_log(self):
         """ログをクリア"""
         self.log_text.clear()
+        self._log_entries.clear()
+        self._pending_logs.clear()
+        self._dropped_logs = 0
         self.add_log(LogLevel.INFO, "ログがクリアされました")
     
     def get_log_content(self) -> str:
-        """ログの内容を取得"""
-        return self.log_text.toPlainText()
+        """ログの内容を取得（表示中のログと同じ範囲）"""
+        return "\n".join(
+            f"[{timestamp}] {LOG_LEVEL_STYLES.get(level, LOG_LEVEL_STYLES[LogLevel.DEBUG])[1]} {level}: {message}"
+            for timestamp, level, message in self._log_entries
+        )
     
     def save_log_to_file(self, filepath: str) -> bool:
         """ログをファイルに保存"""
@@ -395,16 +476,17 @@ class ProgressWidget(QWidget):
         self.overall_progress.setStyleSheet(theme_manager.generate_progress_style("overall"))
         self.file_progress.setStyleSheet(theme_manager.generate_progress_style("file"))
         
-        # ログテキストのスタイル（HTMLコンテンツとの整合性を確保）
+        # ログテキストのスタイル
+        # ログの本文はウィジェットの文字色で表示されるため、既存のログもこの設定だけでテーマに追従する
         log_style = theme_manager.generate_log_style()
         self.log_text.setStyleSheet(log_style)
+        # 時刻の色は文書のスタイルシートで指定する（以降に追加するログに適用される）
+        self.log_text.document().setDefaultStyleSheet(_log_document_css(colors['text_secondary']))
         
         # フレームのスタイル（進捗情報とログセクション）
-        frame_style = theme_manager.generate_frame_style("default")
-        # ウィジェット内のすべてのフレームにスタイルを適用
-        frames = self.findChildren(QFrame)
-        for frame in frames:
-            frame.setStyleSheet(frame_style)
+        # セレクターをオブジェクト名で限定し、子孫のQFrame（QLabelやログ表示）には波及させない
+        for frame, selector in self._themed_frames:
+            frame.setStyleSheet(theme_manager.generate_frame_style("default", selector=selector))
         
         # ステータスラベルの色を更新
         status_style = f"""
@@ -419,23 +501,5 @@ class ProgressWidget(QWidget):
         self.status_label.setStyleSheet(status_style)
         
         # クリアボタンのスタイル
-        clear_button_style = theme_manager.generate_button_style("secondary")
-        clear_button_style = clear_button_style.replace("padding: 8px 16px;", "padding: 4px 12px; font-size: 12px;")
+        clear_button_style = theme_manager.generate_button_style("secondary", padding="4px 12px", font_size="12px")
         self.clear_log_button.setStyleSheet(clear_button_style)
-        
-        # 既存のログを再描画してテーマ反映
-        self._reformat_existing_logs()
-    
-    def _reformat_existing_logs(self):
-        """既存のログをテーマに合わせて再フォーマット"""
-        if not hasattr(self, 'theme_manager') or not self.theme_manager:
-            return
-            
-        # 現在のログ内容を取得
-        current_text = self.log_text.toPlainText()
-        if not current_text.strip():
-            return
-            
-        # ログをクリアして、テーマ適用済みメッセージを追加
-        self.log_text.clear()
-        self.add_log(LogLevel.INFO, "テーマが適用されました")
\ No newline at end of file
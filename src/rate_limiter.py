@@ -10,6 +10,7 @@ import time
 import threading
 from typing import Dict, Any
 from tqdm.auto import tqdm
+from .retry_manager import TranslationCancelledError
 
 
 class RateLimiter:
@@ -93,15 +94,19 @@ class RateLimiter:
                 self._rate_limit_status[provider]["hit"] = False
                 self._rate_limit_status[provider]["waiting_period"] = 0
     
-    def check_and_wait_if_needed(self, provider: str) -> bool:
+    def check_and_wait_if_needed(self, provider: str, cancel_event=None) -> bool:
         """
         レート制限状態を確認し、必要に応じて待機
         
         Args:
             provider: プロバイダー名
+            cancel_event: キャンセル要求（threading.Event、省略可能）
             
         Returns:
             bool: 待機が発生した場合True、そうでなければFalse
+            
+        Raises:
+            TranslationCancelledError: 待機中にキャンセルされた場合
         """
         with self._lock:
             if provider not in self._rate_limit_status:
@@ -127,7 +132,10 @@ class RateLimiter:
                     # ロックを一時的に解放して待機（他のスレッドがブロックされないように）
                     self._lock.release()
                     try:
-                        time.sleep(remaining_wait)
+                        if cancel_event is None:
+                            time.sleep(remaining_wait)
+                        elif cancel_event.wait(remaining_wait):
+                            raise TranslationCancelledError("翻訳処理がキャンセルされました")
                     finally:
                         self._lock.acquire()
                     
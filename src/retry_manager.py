@@ -29,6 +29,11 @@ class HTTPStatusError(APIError):
         super().__init__(self.message)
 
 
+class TranslationCancelledError(Exception):
+    """翻訳処理がキャンセルされた場合の例外（リトライ対象外）"""
+    pass
+
+
 # リトライ対象のエラー種類を定義
 RETRY_EXCEPTIONS = (
     ConnectionError,
@@ -102,7 +107,23 @@ class RetryManager:
                 retry_count = retry_obj.statistics.get('attempt_number')
         return retry_count
     
-    def handle_http_error(self, e, llm_provider: str, retry_count: int, rate_limiter=None):
+    def wait_or_cancel(self, wait_time: float, cancel_event=None):
+        """
+        指定時間待機する（キャンセル要求があれば待機を打ち切る）
+        
+        Args:
+            wait_time: 待機時間（秒）
+            cancel_event: キャンセル要求（threading.Event、省略可能）
+            
+        Raises:
+            TranslationCancelledError: 待機中にキャンセルされた場合
+        """
+        if cancel_event is None:
+            time.sleep(wait_time)
+        elif cancel_event.wait(wait_time):
+            raise TranslationCancelledError("翻訳処理がキャンセルされました")
+    
+    def handle_http_error(self, e, llm_provider: str, retry_count: int, rate_limiter=None, cancel_event=None):
         """
         HTTPエラーの処理
         
@@ -111,6 +132,7 @@ class RetryManager:
             llm_provider: LLMプロバイダー名
             retry_count: 現在のリトライ回数
             rate_limiter: レート制限管理オブジェクト（省略可能）
+            cancel_event: キャンセル要求（threading.Event、省略可能）
         """
         status_code = e.response.status_code if hasattr(e, 'response') and hasattr(e.response, 'status_code') else 0
         
@@ -154,7 +176,7 @@ class RetryManager:
                 rate_limiter.set_waiting_period(llm_provider, wait_time)
                 
                 tqdm.write(f"  ! レート制限に達しました (リトライ {retry_count}/{self.max_retries}): {wait_time}秒待機します")
-                time.sleep(wait_time)  # 明示的な待機
+                self.wait_or_cancel(wait_time, cancel_event)  # 明示的な待機（キャンセル時は打ち切る）
             
             raise HTTPStatusError(429, error_msg)
         
@@ -199,7 +221,7 @@ class RetryManager:
         # 最終的にUnicodeEncodeErrorとして再発生
         raise e
     
-    def handle_resource_exhausted_error(self, e, llm_provider: str, retry_count: int, rate_limiter=None):
+    def handle_resource_exhausted_error(self, e, llm_provider: str, retry_count: int, rate_limiter=None, cancel_event=None):
         """
         ResourceExhaustedエラー（レート制限）の処理
         
@@ -208,6 +230,7 @@ class RetryManager:
             llm_provider: LLMプロバイダー名
             retry_count: 現在のリトライ回数
             rate_limiter: レート制限管理オブジェクト（省略可能）
+            cancel_event: キャンセル要求（threading.Event、省略可能）
         """
         if rate_limiter:
             # レート制限状態を更新
@@ -236,7 +259,7 @@ class RetryManager:
             rate_limiter.set_waiting_period(llm_provider, wait_time)
             
             tqdm.write(f"  ! レート制限エラーが発生しました (リトライ {retry_count}/{self.max_retries}): {wait_time}秒待機します")
-            time.sleep(wait_time)  # 明示的な待機
+            self.wait_or_cancel(wait_time, cancel_event)  # 明示的な待機（キャンセル時は打ち切る）
             
         raise HTTPStatusError(429, f"レート制限エラー: {str(e)}")
     
@@ -31,7 +31,7 @@ from .providers import (
 )
 
 # 既存のモジュールをインポート
-from .retry_manager import RetryManager, RETRY_EXCEPTIONS
+from .retry_manager import RetryManager, RETRY_EXCEPTIONS, TranslationCancelledError
 from .rate_limiter import RateLimiter, global_rate_limiter
 from src.unicode_handler import normalize_unicode_text, validate_text_for_api
 
@@ -92,6 +92,9 @@ class TranslatorService:
         self.retry_manager = RetryManager(max_retries=5, multiplier=3, min_wait=10, max_wait=180)
         self.rate_limiter = global_rate_limiter
         
+        # 外部からのキャンセル要求（threading.Event）。translate_pageに個別に渡されない場合に使用する
+        self.cancel_event = None
+        
         tqdm.write(f"翻訳サービスを初期化しました: {self._get_provider_display_name()} ({self.model_name})")
     
     def _load_environment(self):
@@ -243,22 +246,22 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
         
         return prompt
     
-    def _call_provider_with_retry(self, prompt: str) -> str:
+    def _call_provider_with_retry(self, prompt: str, retry_count: int = 1, cancel_event=None) -> str:
         """
         リトライ機能を持つプロバイダー呼び出し
         
         Args:
             prompt: 送信するプロンプト
+            retry_count: 呼び出し元の現在の試行回数
+            cancel_event: キャンセル要求（threading.Event、省略可能）
             
         Returns:
             プロバイダーからの応答テキスト
             
         Raises:
             APIError: API呼び出しに失敗した場合
+            TranslationCancelledError: キャンセルされた場合
         """
-        # リトライカウントを取得
-        retry_count = self.retry_manager.get_retry_count(self._call_provider_with_retry)
-        
         try:
             # タイムアウト付きでプロバイダーを使用してAPI呼び出し
             import threading
@@ -288,6 +291,9 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
             while worker_thread.is_alive():
                 elapsed = time.time() - start_time
                 
+                if cancel_event is not None and cancel_event.is_set():
+                    raise TranslationCancelledError("翻訳処理がキャンセルされました")
+                
                 if elapsed > timeout_seconds:
                     tqdm.write(f"  ⚠️ [GUI-DEBUG] API呼び出しタイムアウト ({timeout_seconds}秒)")
                     raise APIError(f"API呼び出しがタイムアウトしました ({timeout_seconds}秒)")
@@ -310,10 +316,14 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
             else:
                 raise APIError("API呼び出しが予期せず終了しました")
             
+        except TranslationCancelledError:
+            # キャンセルはリトライせずにそのまま呼び出し元へ伝える
+            raise
+            
         except RateLimitError as e:
             # レート制限エラーの処理
             self.retry_manager.handle_resource_exhausted_error(
-                e, self.provider_name, retry_count, self.rate_limiter
+                e, self.provider_name, retry_count, self.rate_limiter, cancel_event
             )
             # エラーハンドリング後、適切にエラーを再発生させる
             raise APIError(f"レート制限エラーにより翻訳に失敗しました: {e}")
@@ -321,7 +331,7 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
         except HTTPStatusError as e:
             # HTTPステータスエラーの処理
             self.retry_manager.handle_http_error(
-                e, self.provider_name, retry_count, self.rate_limiter
+                e, self.provider_name, retry_count, self.rate_limiter, cancel_event
             )
             # エラーハンドリング後、適切にエラーを再発生させる
             raise APIError(f"HTTPエラーにより翻訳に失敗しました: {e}")
@@ -339,7 +349,7 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
             # ResourceExhaustedエラー（レート制限）の処理
             if "ResourceExhausted" in error_type or "ResourceExhausted" in str(e) or "429" in str(e):
                 self.retry_manager.handle_resource_exhausted_error(
-                    e, self.provider_name, retry_count, self.rate_limiter
+                    e, self.provider_name, retry_count, self.rate_limiter, cancel_event
                 )
                 # エラーハンドリング後、適切にエラーを再発生させる
                 raise APIError(f"リソース枯渇エラーにより翻訳に失敗しました: {e}")
@@ -357,7 +367,8 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
                 raise APIError(f"一般的なエラーにより翻訳に失敗しました: {e}")
     
     def translate_page(self, text: str, page_info: Optional[Dict[str, int]] = None, 
-                      previous_headers: Optional[List[str]] = None, target_lang: str = "ja") -> Tuple[str, List[str]]:
+                      previous_headers: Optional[List[str]] = None, target_lang: str = "ja",
+                      cancel_event=None) -> Tuple[str, List[str]]:
         """
         1ページ分のテキストを翻訳する
         
@@ -366,6 +377,7 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
             page_info: {'current': 現在のページ番号, 'total': 合計ページ数} の形式の辞書
             previous_headers: 前のページで使用されたヘッダーのリスト
             target_lang: 翻訳先の言語
+            cancel_event: この呼び出しのキャンセル要求（省略時はself.cancel_eventを使用）
             
         Returns:
             tuple: (翻訳されたテキスト, 抽出されたヘッダーのリスト)
@@ -373,10 +385,17 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
         Raises:
             ValidationError: 設定が無効な場合
             APIError: API呼び出しに失敗した場合
+            TranslationCancelledError: キャンセルされた場合
         """
+        # 試行回数とキャンセル要求は呼び出しごとに保持する
+        # （複数スレッドから同時に呼び出されても互いの状態が混ざらないようにする）
+        if cancel_event is None:
+            cancel_event = self.cancel_event
+        retry_count = self.retry_manager.get_retry_count(self.translate_page)
+        
         try:
             # レート制限状態を確認し、必要に応じて待機
-            self.rate_limiter.check_and_wait_if_needed(self.provider_name)
+            self.rate_limiter.check_and_wait_if_needed(self.provider_name, cancel_event)
             
             # ページ情報があれば、ログに残す
             if page_info:
@@ -416,7 +435,6 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
             prompt = self._create_translation_prompt(text, target_lang, previous_headers)
             
             # リトライカウントの表示
-            retry_count = self.retry_manager.get_retry_count(self.translate_page)
             if retry_count > 1:
                 page_str = f"ページ {page_info['current']}/{page_info['total']}" if page_info else "現在のページ"
                 tqdm.write(f"  ↻ {page_str} の翻訳を再試行中 (試行 {retry_count}/{self.retry_manager.max_retries})")
@@ -428,7 +446,7 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
             tqdm.write(f"  🔄 [GUI-DEBUG] API呼び出し開始 - {time.strftime('%H:%M:%S')}")
             
             # リトライ機能付き呼び出し
-            result = self._call_provider_with_retry(prompt)
+            result = self._call_provider_with_retry(prompt, retry_count, cancel_event)
             
             # GUI用デバッグログ: API呼び出し完了
             api_duration = time.time() - start_time
@@ -450,9 +468,11 @@ Markdownとして体裁を整えてください。特にヘッダーは以下の
             extracted_headers = self.extract_headers(result)
             return result, extracted_headers
             
+        except TranslationCancelledError:
+            raise
+            
         except RETRY_EXCEPTIONS as e:
             # リトライ対象のエラーの場合は新しいモジュールで処理
-            retry_count = self.retry_manager.get_retry_count(self.translate_page)
             remaining = self.retry_manager.max_retries - retry_count
             
             # リトライ例外処理を新しいモジュールに委譲